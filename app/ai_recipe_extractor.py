@@ -5,80 +5,26 @@ Extracts structured recipe data from Instagram post descriptions and other
 unstructured recipe text in both English and French.
 """
 
-import json
+import hashlib
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from typing import Any
 
-from openai import OpenAI
+from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
-
-
-class AIExtractionError(Exception):
-    """Raised when AI recipe extraction fails."""
-    pass
-
-
-@dataclass
-class ExtractedRecipeData:
-    """AI-extracted recipe data with confidence score."""
-    name: str
-    servings: int | None
-    prep_time_minutes: int | None
-    cook_time_minutes: int | None
-    ingredients: list[dict[str, Any]]  # [{"item": str, "quantity": float, "unit": str, "category": str}]
-    instructions: list[str]
-    tags: list[str]
-    language: str  # 'en' or 'fr'
-    confidence: float  # 0-1
-    reheats_well: bool = False
-    stores_days: int = 0
-    packs_well_as_lunch: bool = False
-
-
-class AIRecipeExtractor:
-    """Orchestrates AI-powered recipe extraction."""
-
-    def __init__(self, openai_api_key: str):
-        """
-        Initialize AI recipe extractor.
+from app.extraction_cache import get_extraction_cache, make_cache_key
+from app.openai_client import get_openai_client
 
-        Args:
-            openai_api_key: OpenAI API key
-        """
-        self.client = OpenAI(api_key=openai_api_key)
-
-    def _build_extraction_prompt(self, text: str) -> str:
-        """
-        Build extraction prompt with few-shot examples.
-
-        Args:
-            text: Unstructured recipe text
-
-        Returns:
-            System prompt for GPT-4o
-        """
-        return """You are a recipe extraction expert. Extract structured recipe data from unstructured text.
+logger = logging.getLogger(__name__)
 
-OUTPUT FORMAT (JSON):
-{
-  "name": "Recipe name",
-  "servings": 4,
-  "prep_time_minutes": 15,
-  "cook_time_minutes": 30,
-  "ingredients": [
-    {"item": "spaghetti", "quantity": 400, "unit": "g", "category": "grains"},
-    {"item": "eggs", "quantity": 4, "unit": "whole", "category": "dairy"}
-  ],
-  "instructions": ["Step 1: ...", "Step 2: ..."],
-  "tags": ["italian", "pasta", "quick"],
-  "language": "en",
-  "confidence": 0.92,
-  "reheats_well": true,
-  "stores_days": 3,
-  "packs_well_as_lunch": false
-}
+# System prompt with field guidance and one few-shot example in the language
+# of the input. The output schema is enforced through Structured Outputs (see
+# ExtractedRecipeModel) so it is not spelled out here. The prompts are built
+# once at import time and the user text is sent as a separate message, so each
+# language variant stays byte-identical per call and OpenAI can serve it from
+# the prompt cache. Avoid cosmetic edits: every change invalidates the cache.
+_PROMPT_COMMON = """You are a recipe extraction expert. Extract structured recipe data from unstructured text.
 
 INSTRUCTIONS:
 1. **Ingredients**: Separate quantity, unit, and item. If quantity is missing, use null. If unit is missing, use "whole" for countable items or "to taste" for seasonings.
@@ -93,9 +39,11 @@ INSTRUCTIONS:
 10. **stores_days**: days the dish safely keeps refrigerated (0–5). 0 = must eat same day. Typical: soups/stews = 4, pasta = 3, stir-fry = 2, fresh fish = 1, salad = 0.
 11. **packs_well_as_lunch**: true if leftovers pack well in a container without quality loss (stews, grain bowls, pasta, wraps). false for burgers, fried items, fresh assembly dishes.
 
-EXAMPLES:
+EXAMPLE:
+
+"""
 
-Input (English):
+_FEW_SHOT_EN = """Input (English):
 "Creamy Carbonara 🍝
 Serves 4 | Prep: 10 min | Cook: 15 min
 
@@ -140,7 +88,9 @@ Output:
   "confidence": 0.95
 }
 
-Input (French):
+"""
+
+_FEW_SHOT_FR = """Input (French):
 "Soupe à l'oignon gratinée
 Pour 4 personnes | Préparation: 20 min | Cuisson: 45 min
 
@@ -186,15 +136,120 @@ Output:
   "confidence": 0.93
 }
 
-Now extract the recipe from the following text:"""
+"""
+
+_PROMPT_SUFFIX = "Now extract the recipe from the following text:"
+
+_EXTRACTION_PROMPTS: dict[str, str] = {
+    "en": _PROMPT_COMMON + _FEW_SHOT_EN + _PROMPT_SUFFIX,
+    "fr": _PROMPT_COMMON + _FEW_SHOT_FR + _PROMPT_SUFFIX,
+}
+
+_MODEL = "gpt-4o"
+
+# Routes requests sharing a prompt variant to the same cache; derived from
+# the prompt itself so it rotates automatically whenever the prompt changes.
+_PROMPT_CACHE_KEYS: dict[str, str] = {
+    language: "ai-recipe-extractor-" + hashlib.sha256(prompt.encode()).hexdigest()[:16]
+    for language, prompt in _EXTRACTION_PROMPTS.items()
+}
+
+# Words that only show up in French recipe text; their presence selects the
+# French few-shot example.
+_FRENCH_MARKERS = ("ingrédients", "étapes", "cuillère", "préparation", "cuisson")
 
-    def extract_recipe(self, text: str, source_hint: str = "instagram") -> ExtractedRecipeData:
+
+def _detect_language(text: str) -> str:
+    """Return "fr" if *text* looks like a French recipe, else "en"."""
+    text_lower = text.lower()
+    return "fr" if any(marker in text_lower for marker in _FRENCH_MARKERS) else "en"
+
+
+# Shortest text worth sending to the model; anything below cannot hold both an
+# ingredient list and instructions.
+_MIN_RECIPE_TEXT_LENGTH = 40
+
+
+def _looks_like_recipe(text: str) -> bool:
+    """Cheap pre-filter rejecting input that cannot possibly contain a recipe.
+
+    Requires a minimum length and either a quantity (any digit) or more than
+    one line, which every real ingredient list has.
+    """
+    if len(text) < _MIN_RECIPE_TEXT_LENGTH:
+        return False
+    return "\n" in text or any(ch.isdigit() for ch in text)
+
+
+class AIExtractionError(Exception):
+    """Raised when AI recipe extraction fails."""
+    pass
+
+
+class ExtractedIngredientModel(BaseModel):
+    """Structured Outputs schema for a single extracted ingredient."""
+    item: str
+    quantity: float | None
+    unit: str
+    category: str
+
+
+class ExtractedRecipeModel(BaseModel):
+    """Structured Outputs schema the model is constrained to when extracting."""
+    name: str
+    servings: int | None
+    prep_time_minutes: int | None
+    cook_time_minutes: int | None
+    ingredients: list[ExtractedIngredientModel]
+    instructions: list[str]
+    tags: list[str]
+    language: str
+    confidence: float
+    reheats_well: bool
+    stores_days: int
+    packs_well_as_lunch: bool
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ExtractedRecipeData:
+    """AI-extracted recipe data with confidence score."""
+    name: str
+    servings: int | None
+    prep_time_minutes: int | None
+    cook_time_minutes: int | None
+    ingredients: list[dict[str, Any]]  # [{"item": str, "quantity": float, "unit": str, "category": str}]
+    instructions: list[str]
+    tags: list[str]
+    language: str  # 'en' or 'fr'
+    confidence: float  # 0-1
+    reheats_well: bool = False
+    stores_days: int = 0
+    packs_well_as_lunch: bool = False
+
+
+class AIRecipeExtractor:
+    """Orchestrates AI-powered recipe extraction."""
+
+    def __init__(self, openai_api_key: str):
+        """
+        Initialize AI recipe extractor.
+
+        Args:
+            openai_api_key: OpenAI API key
+        """
+        self.client = get_openai_client(openai_api_key)
+        self.cache = get_extraction_cache()
+
+    def extract_recipe(
+        self, text: str, source_hint: str = "instagram", language: str = "auto"
+    ) -> ExtractedRecipeData:
         """
         Extract recipe from unstructured text using AI.
 
         Args:
             text: Unstructured recipe text (e.g., Instagram caption)
             source_hint: Hint about text source (for context)
+            language: "en" or "fr" to pick the few-shot example, or "auto" to detect
 
         Returns:
             ExtractedRecipeData object
@@ -202,40 +257,57 @@ Now extract the recipe from the following text:"""
         Raises:
             AIExtractionError: If extraction fails
         """
-        import time
         logger.info("Starting AI recipe extraction", extra={"text_length": len(text), "source_hint": source_hint})
+
+        text = text.strip()
+        if not _looks_like_recipe(text):
+            raise AIExtractionError(
+                "Text is too short or has no quantities to be a recipe. "
+                "Please include the ingredients list and cooking steps."
+            )
+
+        if language not in _EXTRACTION_PROMPTS:
+            language = _detect_language(text)
+        system_prompt = _EXTRACTION_PROMPTS[language]
+        prompt_cache_key = _PROMPT_CACHE_KEYS[language]
+
+        cache_key = make_cache_key(_MODEL, prompt_cache_key, text)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("AI recipe extraction served from cache", extra={"recipe_name": cached.get("name")})
+                return ExtractedRecipeData(**cached)
+
         t0 = time.monotonic()
         try:
-            # Build prompt
-            system_prompt = self._build_extraction_prompt(text)
-
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
+            # Call OpenAI API; the response is constrained to ExtractedRecipeModel
+            response = self.client.chat.completions.parse(
+                model=_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": text}
                 ],
-                response_format={"type": "json_object"},
+                response_format=ExtractedRecipeModel,
+                prompt_cache_key=prompt_cache_key,
                 temperature=0.3,  # Lower temperature for more consistent extraction
-                max_tokens=2000
+                max_tokens=1200  # Recipes are ~400-900 tokens as compact JSON; caps worst-case decode time
             )
 
-            # Parse response
-            result_text = response.choices[0].message.content
-            result = json.loads(result_text)
+            message = response.choices[0].message
+            result = message.parsed
+            if result is None:
+                raise AIExtractionError(
+                    f"AI declined to extract a recipe: {message.refusal or 'no content returned'}"
+                )
 
             # Validate required fields
-            if not result.get("name"):
-                result["name"] = "Unknown Recipe"
-
-            if not result.get("ingredients"):
+            if not result.ingredients:
                 raise AIExtractionError(
                     "Could not extract ingredients from text. "
                     "Please ensure the recipe includes an ingredients list."
                 )
 
-            if not result.get("instructions"):
+            if not result.instructions:
                 raise AIExtractionError(
                     "Could not extract instructions from text. "
                     "Please ensure the recipe includes cooking steps."
@@ -243,18 +315,18 @@ Now extract the recipe from the following text:"""
 
             # Build ExtractedRecipeData
             extracted = ExtractedRecipeData(
-                name=result.get("name", "Unknown Recipe"),
-                servings=result.get("servings"),
-                prep_time_minutes=result.get("prep_time_minutes"),
-                cook_time_minutes=result.get("cook_time_minutes"),
-                ingredients=result.get("ingredients", []),
-                instructions=result.get("instructions", []),
-                tags=result.get("tags", []),
-                language=result.get("language", "en"),
-                confidence=result.get("confidence", 0.5),
-                reheats_well=result.get("reheats_well", False),
-                stores_days=result.get("stores_days", 0),
-                packs_well_as_lunch=result.get("packs_well_as_lunch", False),
+                name=result.name or "Unknown Recipe",
+                servings=result.servings,
+                prep_time_minutes=result.prep_time_minutes,
+                cook_time_minutes=result.cook_time_minutes,
+                ingredients=[ingredient.model_dump() for ingredient in result.ingredients],
+                instructions=result.instructions,
+                tags=result.tags,
+                language=result.language or "en",
+                confidence=result.confidence,
+                reheats_well=result.reheats_well,
+                stores_days=result.stores_days,
+                packs_well_as_lunch=result.packs_well_as_lunch,
             )
             logger.info(
                 "AI recipe extraction complete",
@@ -264,11 +336,10 @@ Now extract the recipe from the following text:"""
                     "elapsed_s": round(time.monotonic() - t0, 2),
                 },
             )
+            if self.cache is not None:
+                self.cache.set(cache_key, asdict(extracted))
             return extracted
 
-        except json.JSONDecodeError as e:
-            logger.exception("Failed to parse AI response as JSON", extra={"source_hint": source_hint})
-            raise AIExtractionError(f"Failed to parse AI response as JSON: {str(e)}") from e
         except Exception as e:
             if isinstance(e, AIExtractionError):
                 raise
@@ -1,5 +1,6 @@
 """Recipe import routes — URL, text, and image."""
 
+import asyncio
 import logging
 import time
 
@@ -7,9 +8,16 @@ from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import config
+from app.ai_recipe_extractor import AIExtractionError
 from app.db import crud
 from app.db.engine import get_db
+from app.image_recipe_extractor import ImageRecipeExtractor
+from app.instagram_fetcher import InstagramFetchError
+from app.instagram_parser import InstagramParser
+from app.nutrition_generator import get_nutrition_generator
+from app.recipe_parser import ParsedRecipe, RecipeParseError, RecipeParser, generate_recipe_id
 from app.recipes import Recipe, RecipeSaveError
+from app.tag_inference import get_tag_inferencer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -40,38 +48,35 @@ def _is_valid_image_bytes(data: bytes) -> bool:
 # Shared helper
 # ---------------------------------------------------------------------------
 
+# Generated nutrition attributes copied onto the parsed recipe as
+# "<field>_per_serving"; calories is cast to int separately.
+_NUTRITION_FIELDS = (
+    "protein", "carbs", "fat", "saturated_fat", "polyunsaturated_fat",
+    "monounsaturated_fat", "sodium", "potassium", "fiber", "sugar",
+    "vitamin_a", "vitamin_c", "calcium", "iron",
+)
+
+
 async def _finalize_and_save_recipe(
     parsed_recipe,
     db: AsyncSession,
     source: str = "",
 ) -> dict:
     """Generate nutrition, infer tags, upsert to DB, return response dict."""
-    from app.nutrition_generator import NutritionGenerator
-    from app.tag_inference import TagInferencer
-
-    nutrition_gen = NutritionGenerator(api_key=config.USDA_API_KEY)
-    tag_inferencer = TagInferencer()
+    nutrition_gen = get_nutrition_generator(config.USDA_API_KEY)
+    tag_inferencer = get_tag_inferencer()
 
     if nutrition_gen.should_generate_nutrition(parsed_recipe):
-        generated_nutrition = nutrition_gen.generate_from_ingredients(
-            parsed_recipe.ingredients, parsed_recipe.servings or 4
+        # One rate-limited USDA request per ingredient; keep the event loop free.
+        generated_nutrition = await asyncio.to_thread(
+            nutrition_gen.generate_from_ingredients,
+            parsed_recipe.ingredients,
+            parsed_recipe.servings or 4,
         )
         if generated_nutrition:
+            for field in _NUTRITION_FIELDS:
+                setattr(parsed_recipe, f"{field}_per_serving", getattr(generated_nutrition, field))
             parsed_recipe.calories_per_serving = int(generated_nutrition.calories)
-            parsed_recipe.protein_per_serving = generated_nutrition.protein
-            parsed_recipe.carbs_per_serving = generated_nutrition.carbs
-            parsed_recipe.fat_per_serving = generated_nutrition.fat
-            parsed_recipe.saturated_fat_per_serving = generated_nutrition.saturated_fat
-            parsed_recipe.polyunsaturated_fat_per_serving = generated_nutrition.polyunsaturated_fat
-            parsed_recipe.monounsaturated_fat_per_serving = generated_nutrition.monounsaturated_fat
-            parsed_recipe.sodium_per_serving = generated_nutrition.sodium
-            parsed_recipe.potassium_per_serving = generated_nutrition.potassium
-            parsed_recipe.fiber_per_serving = generated_nutrition.fiber
-            parsed_recipe.sugar_per_serving = generated_nutrition.sugar
-            parsed_recipe.vitamin_a_per_serving = generated_nutrition.vitamin_a
-            parsed_recipe.vitamin_c_per_serving = generated_nutrition.vitamin_c
-            parsed_recipe.calcium_per_serving = generated_nutrition.calcium
-            parsed_recipe.iron_per_serving = generated_nutrition.iron
 
             has_meaningful = (
                 generated_nutrition.calories > 0
@@ -93,10 +98,7 @@ async def _finalize_and_save_recipe(
         existing_tags=parsed_recipe.tags or [],
     )
 
-    from app.recipe_parser import generate_recipe_id
-
-    existing_recipes = await crud.get_recipes(db, config.DEFAULT_HOUSEHOLD_ID)
-    existing_ids = {r.id for r in existing_recipes}
+    existing_ids = await crud.get_recipe_ids(db, config.DEFAULT_HOUSEHOLD_ID)
     recipe_id = generate_recipe_id(parsed_recipe.name, existing_ids)
     recipe_dict = parsed_recipe.to_recipe_dict(recipe_id)
     new_recipe = Recipe.from_dict(recipe_dict)
@@ -122,9 +124,10 @@ async def _finalize_and_save_recipe(
         },
     }
 
-    if hasattr(parsed_recipe, "ai_confidence"):
-        response_data["recipe"]["ai_confidence"] = parsed_recipe.ai_confidence
-        if parsed_recipe.ai_confidence < 0.7:
+    ai_confidence = getattr(parsed_recipe, "ai_confidence", None)
+    if ai_confidence is not None:
+        response_data["recipe"]["ai_confidence"] = ai_confidence
+        if ai_confidence < 0.7:
             response_data["warning"] = (
                 "Recipe extraction confidence is low. "
                 "Please review the imported data carefully."
@@ -133,37 +136,20 @@ async def _finalize_and_save_recipe(
     return response_data
 
 
-# ---------------------------------------------------------------------------
-# Routes
-# ---------------------------------------------------------------------------
-
-
-@router.post("/import-recipe")
-async def import_recipe(request: Request, db: AsyncSession = Depends(get_db)):
-    """Import a recipe from a URL."""
-    logger.info("Importing recipe from URL")
-
-    try:
-        data = await request.json()
-    except Exception:
-        raise HTTPException(400, detail="Invalid JSON") from None
-
-    if not data or "url" not in data:
-        raise HTTPException(400, detail="URL is required")
+# URL imports currently running in this worker, keyed by URL. A future
+# resolved to _IMPORT_ABANDONED means the importing request was cancelled.
+_inflight_url_imports: dict[str, asyncio.Future] = {}
+_IMPORT_ABANDONED = object()
 
-    url = data["url"]
-    if not url.startswith("http://") and not url.startswith("https://"):
-        raise HTTPException(400, detail="URL must start with http:// or https://")
 
+async def _import_from_url(url: str, db: AsyncSession) -> dict:
+    """Parse *url*, then generate nutrition/tags and save the recipe."""
     try:
-        from app.ai_recipe_extractor import AIExtractionError
-        from app.instagram_fetcher import InstagramFetchError
-        from app.recipe_parser import RecipeParseError, RecipeParser
-
         logger.info("Parsing recipe from URL", extra={"url": url})
         t0 = time.monotonic()
         parser = RecipeParser()
-        parsed_recipe = parser.parse_from_url(url)
+        # Fetching and parsing block for seconds; keep the event loop free.
+        parsed_recipe = await asyncio.to_thread(parser.parse_from_url, url)
         logger.info(
             "LLM call completed",
             extra={"elapsed_s": round(time.monotonic() - t0, 2), "recipe_name": parsed_recipe.name},
@@ -171,10 +157,6 @@ async def import_recipe(request: Request, db: AsyncSession = Depends(get_db)):
         return await _finalize_and_save_recipe(parsed_recipe, db)
 
     except Exception as e:
-        from app.ai_recipe_extractor import AIExtractionError
-        from app.instagram_fetcher import InstagramFetchError
-        from app.recipe_parser import RecipeParseError
-
         if isinstance(e, InstagramFetchError):
             raise HTTPException(400, detail=str(e)) from e
         if isinstance(e, AIExtractionError):
@@ -189,6 +171,56 @@ async def import_recipe(request: Request, db: AsyncSession = Depends(get_db)):
         raise HTTPException(500, detail=f"Unexpected error: {e}") from e
 
 
+# ---------------------------------------------------------------------------
+# Routes
+# ---------------------------------------------------------------------------
+
+
+@router.post("/import-recipe")
+async def import_recipe(request: Request, db: AsyncSession = Depends(get_db)):
+    """Import a recipe from a URL."""
+    logger.info("Importing recipe from URL")
+
+    try:
+        data = await request.json()
+    except Exception:
+        raise HTTPException(400, detail="Invalid JSON") from None
+
+    if not data or "url" not in data:
+        raise HTTPException(400, detail="URL is required")
+
+    url = data["url"]
+    if not url.startswith("http://") and not url.startswith("https://"):
+        raise HTTPException(400, detail="URL must start with http:// or https://")
+
+    # Coalesce concurrent imports of the same URL onto the first one, so a
+    # double submit pays for one fetch/extraction and saves one recipe. If the
+    # request running the import is cancelled, the ones waiting on it start
+    # over instead of being cancelled with it.
+    while (inflight := _inflight_url_imports.get(url)) is not None:
+        logger.info("Joining in-flight import", extra={"url": url})
+        result = await asyncio.shield(inflight)
+        if result is not _IMPORT_ABANDONED:
+            return result
+
+    inflight = asyncio.get_running_loop().create_future()
+    _inflight_url_imports[url] = inflight
+    try:
+        result = await _import_from_url(url, db)
+    except asyncio.CancelledError:
+        inflight.set_result(_IMPORT_ABANDONED)
+        raise
+    except Exception as e:
+        inflight.set_exception(e)
+        inflight.exception()  # mark retrieved: there may be no other waiter
+        raise
+    else:
+        inflight.set_result(result)
+        return result
+    finally:
+        del _inflight_url_imports[url]
+
+
 @router.post("/import-recipe-text")
 async def import_recipe_text(request: Request, db: AsyncSession = Depends(get_db)):
     """Import a recipe from manually pasted text."""
@@ -209,13 +241,9 @@ async def import_recipe_text(request: Request, db: AsyncSession = Depends(get_db
         raise HTTPException(400, detail="Recipe text must be at least 50 characters long")
 
     try:
-        from app.ai_recipe_extractor import AIExtractionError
-        from app.instagram_parser import InstagramParser
-        from app.recipe_parser import RecipeParseError
-
         instagram_parser = InstagramParser(openai_api_key=config.OPENAI_API_KEY)
         t0 = time.monotonic()
-        parsed_recipe = instagram_parser.parse_from_text(text, language)
+        parsed_recipe = await asyncio.to_thread(instagram_parser.parse_from_text, text, language)
         logger.info(
             "LLM call completed",
             extra={"elapsed_s": round(time.monotonic() - t0, 2), "recipe_name": parsed_recipe.name},
@@ -223,9 +251,6 @@ async def import_recipe_text(request: Request, db: AsyncSession = Depends(get_db
         return await _finalize_and_save_recipe(parsed_recipe, db, source="from text")
 
     except Exception as e:
-        from app.ai_recipe_extractor import AIExtractionError
-        from app.recipe_parser import RecipeParseError
-
         if isinstance(e, AIExtractionError):
             raise HTTPException(400, detail=str(e)) from e
         if isinstance(e, RecipeParseError):
@@ -272,12 +297,9 @@ async def import_recipe_image(
         raise HTTPException(500, detail="Image import is not configured on the server")
 
     try:
-        from app.image_recipe_extractor import ImageRecipeExtractor
-        from app.recipe_parser import ParsedRecipe
-
         extractor = ImageRecipeExtractor(api_key=config.OPENAI_API_KEY)
         t0 = time.monotonic()
-        extracted_data = extractor.extract_recipe(image_data, file_ext)
+        extracted_data = await asyncio.to_thread(extractor.extract_recipe, image_data, file_ext)
         logger.info(
             "LLM call completed",
             extra={
@@ -297,8 +319,6 @@ async def import_recipe_image(
         raise HTTPException(500, detail=f"An error occurred while processing the image: {err}") from e
 
     try:
-        from app.recipe_parser import ParsedRecipe
-
         tags = extracted_data.tags + ["photo-imported"]
         instructions = extracted_data.instructions or []
         if extracted_data.notes:
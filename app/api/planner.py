@@ -1,16 +1,19 @@
 """Planner routes — plan generation, current plan, manual plan edits."""
 
+import asyncio
 import datetime
 import logging
 import random
 import threading
 import time
 import uuid
+from collections import defaultdict
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import config
+from app.api.responses import json_response
 from app.db import crud
 from app.db.engine import get_db
 from app.planner import (
@@ -37,8 +40,6 @@ _NORM_TASK_TTL = 3600
 
 def _norm_task_run(task_id: str, snapshot, plan_id: str, db_url: str) -> None:
     """Background thread: LLM-normalize snapshot and persist to DB."""
-    import asyncio
-
     from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
     async def _run():
@@ -187,10 +188,11 @@ def _build_plan_from_overrides(
 ) -> WeeklyPlan:
     """Build a WeeklyPlan from overrides dict without touching the DB."""
     effective_limit = calorie_limit if calorie_limit is not None else config.DAILY_CALORIE_LIMIT
+    recipes_by_id = {r.id: r for r in recipes}
     meals = []
     for day, day_meals in overrides.items():
         for meal_type, meal_data in day_meals.items():
-            recipe = next((r for r in recipes if r.id == meal_data["recipe_id"]), None)
+            recipe = recipes_by_id.get(meal_data["recipe_id"])
             if recipe:
                 meals.append(
                     PlannedMeal(
@@ -214,10 +216,11 @@ async def _rebuild_plan_from_overrides(
 ) -> tuple[WeeklyPlan, str]:
     """Rebuild WeeklyPlan from overrides dict and persist it."""
     effective_limit = calorie_limit if calorie_limit is not None else config.DAILY_CALORIE_LIMIT
+    recipes_by_id = {r.id: r for r in recipes}
     meals = []
     for day, day_meals in overrides.items():
         for meal_type, meal_data in day_meals.items():
-            recipe = next((r for r in recipes if r.id == meal_data["recipe_id"]), None)
+            recipe = recipes_by_id.get(meal_data["recipe_id"])
             if recipe:
                 meals.append(
                     PlannedMeal(
@@ -297,6 +300,15 @@ async def generate(db: AsyncSession = Depends(get_db)):
     }
 
 
+def _draw_unused(pool: list[Recipe], used: set[str]) -> Recipe | None:
+    """Pop recipes off a pre-shuffled *pool* until one not in *used* turns up."""
+    while pool:
+        recipe = pool.pop()
+        if recipe.id not in used:
+            return recipe
+    return None
+
+
 @router.post("/generate-with-schedule")
 async def generate_with_schedule(request: Request, db: AsyncSession = Depends(get_db)):
     """Generate a meal plan with custom schedule and per-meal servings."""
@@ -340,26 +352,37 @@ async def generate_with_schedule(request: Request, db: AsyncSession = Depends(ge
             detail=f"Need at least {len(meal_slots)} recipes. Only {len(recipes)} available.",
         )
 
+    # Shuffle one candidate pool per (tag, reheatable-only) once up front and
+    # consume them slot by slot, instead of re-filtering every recipe for each
+    # slot. Key None holds every recipe.
+    pools: dict[tuple[str | None, bool], list[Recipe]] = defaultdict(list)
+    for r in recipes:
+        for tag in (None, *dict.fromkeys(r.tags)):
+            pools[tag, False].append(r)
+            if r.reheats_well:
+                pools[tag, True].append(r)
+    for pool in pools.values():
+        random.shuffle(pool)
+
     overrides: dict = {}
     used_recipes: set[str] = set()
 
     for day, meal_type, servings, can_cook in meal_slots:
-        suitable = [r for r in recipes if meal_type in r.tags and r.id not in used_recipes]
-        if not suitable:
-            suitable = [r for r in recipes if r.id not in used_recipes]
-        if not suitable:
-            raise HTTPException(400, detail=f"Not enough recipes for {day} {meal_type}")
-
+        # No-cook slots prefer any reheatable recipe over a matching tag.
+        preference = [(meal_type, False), (None, False)]
         if not can_cook:
-            reheatable = [r for r in suitable if r.reheats_well]
-            if not reheatable:
-                reheatable = [r for r in recipes if r.reheats_well and r.id not in used_recipes]
-            if reheatable:
-                suitable = reheatable
-            else:
-                logger.warning("No reheatable recipes left for no-cook slot %s %s", day, meal_type)
+            preference[:0] = [(meal_type, True), (None, True)]
+
+        recipe = None
+        for key in preference:
+            recipe = _draw_unused(pools[key], used_recipes)
+            if recipe is not None:
+                break
+        if recipe is None:
+            raise HTTPException(400, detail=f"Not enough recipes for {day} {meal_type}")
+        if not can_cook and not recipe.reheats_well:
+            logger.warning("No reheatable recipes left for no-cook slot %s %s", day, meal_type)
 
-        recipe = random.choice(suitable)
         used_recipes.add(recipe.id)
         overrides.setdefault(day, {})[meal_type] = {
             "recipe_id": recipe.id,
@@ -450,36 +473,30 @@ async def get_current_plan(db: AsyncSession = Depends(get_db)):
     serialized["week_start_date"] = week_start_date.isoformat() if week_start_date else None
     serialized["is_current"] = True
 
-    return {
+    # Serialise each shopping-list item once and group it in the same pass,
+    # rather than rounding and re-walking the list for items_by_category.
+    items = []
+    items_by_category: dict[str, list[dict]] = {}
+    for item in sl.items:
+        entry = {
+            "item": item.item,
+            "quantity": round(item.quantity, 2) if item.quantity is not None else None,
+            "unit": item.unit,
+            "sources": item.sources,
+        }
+        items_by_category.setdefault(item.category, []).append(entry)
+        items.append({**entry, "category": item.category})
+
+    return json_response({
         "plan": serialized,
         "plan_id": plan_id,
-        "week_start_date": week_start_date.isoformat() if week_start_date else None,
+        "week_start_date": serialized["week_start_date"],
         "is_current": True,
         "shopping_list": {
-            "items": [
-                {
-                    "item": item.item,
-                    "quantity": round(item.quantity, 2) if item.quantity is not None else None,
-                    "unit": item.unit,
-                    "category": item.category,
-                    "sources": item.sources,
-                }
-                for item in sl.items
-            ],
-            "items_by_category": {
-                category: [
-                    {
-                        "item": item.item,
-                        "quantity": round(item.quantity, 2) if item.quantity is not None else None,
-                        "unit": item.unit,
-                        "sources": item.sources,
-                    }
-                    for item in items
-                ]
-                for category, items in sl.items_by_category.items()
-            },
+            "items": items,
+            "items_by_category": items_by_category,
         },
-    }
+    })
 
 
 @router.put("/current-plan/meals")
@@ -10,6 +10,7 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import config
+from app.api.responses import json_response
 from app.db import crud
 from app.db.engine import get_db
 from app.recipes import Recipe
@@ -138,23 +139,23 @@ async def recipe_detail(
 async def list_recipes(db: AsyncSession = Depends(get_db)):
     """List all available recipes."""
     logger.debug("Listing all recipes")
-    all_recipes = await crud.get_recipes(db, config.DEFAULT_HOUSEHOLD_ID)
-    return {
+    summaries = await crud.get_recipe_summaries(db, config.DEFAULT_HOUSEHOLD_ID)
+    return json_response({
         "recipes": [
             {
-                "id": r.id,
+                "id": r.slug,
                 "name": r.name,
                 "servings": r.servings,
                 "prep_time_minutes": r.prep_time_minutes,
                 "cook_time_minutes": r.cook_time_minutes,
-                "total_time_minutes": r.total_time_minutes,
-                "calories_per_serving": r.calories_per_serving,
-                "protein_per_serving": r.protein_per_serving,
-                "tags": r.tags,
+                "total_time_minutes": r.prep_time_minutes + r.cook_time_minutes,
+                "calories_per_serving": (r.nutrition or {}).get("calories", 0),
+                "protein_per_serving": (r.nutrition or {}).get("protein", 0.0),
+                "tags": list(r.tags or []),
             }
-            for r in all_recipes
+            for r in summaries
         ]
-    }
+    })
 
 
 @router.post("/recipes")
@@ -198,14 +199,12 @@ async def create_recipe(request: Request, db: AsyncSession = Depends(get_db)):
     if prep_time_minutes < 0 or cook_time_minutes < 0:
         raise HTTPException(400, detail="Time values cannot be negative")
 
-    existing_recipes = await crud.get_recipes(db, config.DEFAULT_HOUSEHOLD_ID)
-    existing_ids = {r.id for r in existing_recipes}
+    existing_ids = await crud.get_recipe_ids(db, config.DEFAULT_HOUSEHOLD_ID)
 
-    from app.ingredient_parser import IngredientParser
+    from app.ingredient_parser import DEFAULT_PARSER as ingredient_parser
     from app.recipe_parser import generate_recipe_id
 
     recipe_id = generate_recipe_id(data["name"], existing_ids)
-    ingredient_parser = IngredientParser()
     parsed_ingredients = []
     for ing in data["ingredients"]:
         if isinstance(ing, str):
@@ -0,0 +1,23 @@
+"""Response helpers shared by the API routers."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to FastAPI's stdlib-based encoder if orjson is not installed yet.
+    orjson = None
+
+
+def json_response(payload: Any) -> Response:
+    """Encode a JSON-native payload with orjson, skipping jsonable_encoder.
+
+    Only for plain dicts/lists of str, numbers, bools and None — the large
+    listing endpoints build those by hand already, so the generic encoder's
+    per-value walk is pure overhead there.
+    """
+    if orjson is None:
+        return JSONResponse(payload)
+    return Response(orjson.dumps(payload), media_type="application/json")
@@ -0,0 +1,115 @@
+"""
+Ingredient category keywords shared by the AI normalizer and the web-recipe parser.
+
+Keywords are matched as case- and accent-insensitive substrings of an
+ingredient name, longest match first; see ingredient_normalizer.infer_category.
+"""
+
+# Category keywords for ingredient classification. A keyword listed under
+# several categories resolves to the first one.
+CATEGORY_KEYWORDS = {
+    'meat': [
+        'chicken', 'beef', 'pork', 'lamb', 'turkey', 'duck', 'veal', 'sausage',
+        'bacon', 'ham', 'prosciutto', 'salami', 'pepperoni', 'ground beef',
+        'ground pork', 'ground turkey', 'steak', 'chop', 'tenderloin', 'breast',
+        'thigh', 'wing', 'ribs', 'brisket', 'pancetta', 'chorizo',
+        'ground chicken', 'meatball', 'meat',
+        # French
+        'poulet', 'bœuf', 'porc', 'agneau', 'dinde', 'canard', 'veau',
+        'saucisse', 'lard', 'jambon', 'viande', 'côtelette', 'filet',
+    ],
+    'seafood': [
+        'fish', 'salmon', 'tuna', 'cod', 'tilapia', 'halibut', 'trout', 'bass',
+        'shrimp', 'prawns', 'crab', 'lobster', 'scallops', 'clams', 'mussels',
+        'oysters', 'squid', 'octopus', 'anchovies', 'sardines',
+        # French
+        'poisson', 'saumon', 'thon', 'morue', 'truite', 'crevette', 'crevettes',
+        'crabe', 'homard', 'pétoncles', 'moules', 'huîtres', 'calamar',
+    ],
+    'produce': [
+        'tomato', 'onion', 'garlic', 'carrot', 'celery', 'potato', 'pepper',
+        'bell pepper', 'jalapeño', 'chili', 'cucumber', 'lettuce', 'spinach',
+        'kale', 'cabbage', 'broccoli', 'cauliflower', 'zucchini', 'eggplant',
+        'mushroom', 'corn', 'peas', 'green beans', 'asparagus', 'artichoke',
+        'avocado', 'apple', 'banana', 'orange', 'lemon', 'lime', 'strawberry',
+        'blueberry', 'raspberry', 'mango', 'pineapple', 'peach', 'pear',
+        'cherry', 'grape', 'watermelon', 'melon', 'ginger', 'herb', 'parsley',
+        'cilantro', 'basil', 'thyme', 'rosemary', 'oregano', 'mint', 'dill',
+        'green bean', 'berry', 'cranberry', 'scallion', 'shallot', 'leek',
+        'squash', 'pumpkin', 'beet', 'radish', 'turnip', 'parsnip',
+        'brussels sprout', 'chard', 'arugula', 'watercress', 'endive',
+        'radicchio', 'fennel', 'okra', 'bok choy',
+        # French
+        'tomate', 'oignon', 'ail', 'carotte', 'céleri', 'pomme de terre',
+        'poivron', 'concombre', 'laitue', 'épinards', 'chou', 'brocoli',
+        'courgette', 'aubergine', 'champignon', 'maïs', 'petits pois',
+        'asperge', 'avocat', 'pomme', 'banane', 'citron', 'fraise', 'mangue',
+        'ananas', 'pêche', 'poire', 'cerise', 'raisin', 'melon', 'gingembre',
+        'persil', 'basilic', 'thym', 'romarin', 'origan', 'menthe',
+    ],
+    'dairy': [
+        'milk', 'cream', 'heavy cream', 'sour cream', 'half and half',
+        'butter', 'cheese', 'cheddar', 'mozzarella', 'parmesan', 'feta',
+        'ricotta', 'cream cheese', 'cottage cheese', 'goat cheese', 'brie',
+        'swiss', 'provolone', 'gouda', 'yogurt', 'greek yogurt', 'egg', 'eggs',
+        'blue cheese', 'mascarpone', 'whipped cream', 'whipping cream',
+        'buttermilk', 'egg white', 'egg yolk',
+        # French
+        'lait', 'crème', 'crème fraîche', 'beurre', 'fromage', 'parmesan',
+        'mozzarella', 'feta', 'ricotta', 'chèvre', 'gruyère', 'yaourt', 'œuf', 'œufs',
+    ],
+    'grains': [
+        'pasta', 'spaghetti', 'penne', 'rigatoni', 'fettuccine', 'linguine',
+        'macaroni', 'noodles', 'rice', 'basmati', 'jasmine', 'arborio', 'wild rice',
+        'quinoa', 'couscous', 'bulgur', 'barley', 'oats', 'bread', 'baguette',
+        'roll', 'bun', 'tortilla', 'pita', 'naan', 'flour', 'cornmeal', 'breadcrumbs',
+        'farro', 'wheat', 'polenta', 'noodle', 'bagel', 'cracker', 'cereal',
+        'granola', 'cornstarch', 'corn starch', 'breadcrumb', 'oat bran',
+        'rolled oat', 'steel cut oat', 'oat flour', 'oatmeal',
+        # French
+        'pâtes', 'spaghetti', 'riz', 'quinoa', 'couscous', 'boulgour',
+        'avoine', 'pain', 'farine', 'chapelure',
+    ],
+    'spices': [
+        'salt', 'pepper', 'black pepper', 'white pepper', 'cayenne', 'paprika',
+        'cumin', 'coriander', 'turmeric', 'cinnamon', 'nutmeg', 'cloves',
+        'cardamom', 'bay leaf', 'chili powder', 'curry powder', 'garam masala',
+        'italian seasoning', 'herbs de provence', 'vanilla', 'extract',
+        'chipotle', 'ancho', 'smoked paprika', 'red pepper flakes', 'red pepper flake',
+        'sea salt', 'kosher salt', 'vanilla extract', 'almond extract',
+        'vanilla bean', 'peppercorn', 'clove', 'allspice', 'garlic powder',
+        'onion powder', 'sage', 'tarragon', 'marjoram', 'curry', 'five spice',
+        'herbes de provence', 'crushed red pepper', 'poppy seed', 'mustard seed',
+        'celery seed', 'fennel seed', 'caraway', 'anise', 'saffron',
+        # French
+        'sel', 'poivre', 'poivre noir', 'paprika', 'cumin', 'coriandre',
+        'curcuma', 'cannelle', 'muscade', 'clou de girofle', 'feuille de laurier',
+        'vanille', 'extrait',
+    ],
+    'pantry': [
+        'oil', 'olive oil', 'vegetable oil', 'coconut oil', 'sesame oil',
+        'vinegar', 'balsamic', 'wine vinegar', 'apple cider vinegar',
+        'soy sauce', 'fish sauce', 'worcestershire', 'hot sauce', 'sriracha',
+        'ketchup', 'mustard', 'mayo', 'mayonnaise', 'honey', 'maple syrup',
+        'sugar', 'brown sugar', 'powdered sugar', 'molasses', 'jam', 'jelly',
+        'peanut butter', 'tahini', 'stock', 'broth', 'bouillon', 'tomato paste',
+        'tomato sauce', 'coconut milk', 'condensed milk', 'evaporated milk',
+        'beans', 'chickpeas', 'lentils', 'kidney beans', 'black beans',
+        'white beans', 'pinto beans', 'nuts', 'almonds', 'walnuts', 'pecans',
+        'cashews', 'peanuts', 'pine nuts', 'seeds', 'sesame seeds', 'pumpkin seeds',
+        'beer', 'wine', 'dressing', 'cocoa', 'chocolate', 'chocolate chip',
+        'canola oil', 'syrup', 'agave', 'confectioner', 'salsa', 'cannellini',
+        'almond butter', 'pistachio', 'hazelnut', 'macadamia', 'sunflower',
+        'chia', 'flax', 'coconut', 'baking powder', 'baking soda', 'yeast',
+        'gelatin', 'dried fruit', 'date', 'fig',
+        'chickpea', 'lentil', 'kidney bean', 'black bean', 'white bean',
+        'pinto bean', 'nut', 'almond', 'walnut', 'pecan', 'cashew', 'peanut',
+        'pine nut', 'seed', 'sesame', 'sesame seed', 'pumpkin seed',
+        # French
+        'huile', "huile d'olive", 'vinaigre', 'vinaigre balsamique', 'sauce soja',
+        'miel', 'sirop', "sirop d'érable", 'sucre', 'sucre brun', 'confiture',
+        'beurre de cacahuète', 'bouillon', 'lait de coco', 'haricots',
+        'pois chiches', 'lentilles', 'noix', 'amandes', 'noix de cajou',
+        'graines', 'graines de sésame',
+    ],
+}
@@ -4,7 +4,7 @@ import secrets
 # Secret key — used for session signing.
 # Set SECRET_KEY in the environment for production; a random key is
 # generated on startup as a safe fallback (sessions won't survive restarts).
-SECRET_KEY = os.environ.get("SECRET_KEY", secrets.token_hex(32))
+SECRET_KEY = os.environ.get("SECRET_KEY") or secrets.token_hex(32)
 
 # USDA FoodData Central API key (REQUIRED for nutrition generation)
 # Get your free API key at: https://fdc.nal.usda.gov/api-key-signup.html
@@ -17,6 +17,12 @@ OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 # Instagram session file (optional, for automatic fetching)
 INSTAGRAM_SESSION_FILE = os.environ.get("INSTAGRAM_SESSION_FILE")
 
+# Exact-match cache of AI extraction results (SQLite file).
+# Set to an empty string to disable caching.
+EXTRACTION_CACHE_FILE = os.environ.get("EXTRACTION_CACHE_FILE", "data/extraction_cache.sqlite3")
+# Days a cached extraction stays valid; 0 keeps entries forever.
+EXTRACTION_CACHE_MAX_AGE_DAYS = int(os.environ.get("EXTRACTION_CACHE_MAX_AGE_DAYS", "30"))
+
 # Spoonacular API key (OPTIONAL - only needed for bulk recipe import scripts)
 # Get your free API key at: https://spoonacular.com/food-api/console#Dashboard
 SPOONACULAR_API_KEY = os.environ.get("SPOONACULAR_API_KEY")
@@ -6,7 +6,7 @@ import datetime
 import uuid
 from datetime import UTC
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Row, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -59,6 +59,42 @@ async def get_recipes(
     return recipes
 
 
+async def get_recipe_ids(db: AsyncSession, household_id: str) -> set[str]:
+    """Return the ids (slugs) of the recipes visible to *household_id*.
+
+    Selects only the slug column, for callers that just need to check for
+    clashes without loading and converting every recipe.
+    """
+    result = await db.execute(
+        select(RecipeModel.slug).where(
+            (RecipeModel.household_id == household_id) | (RecipeModel.household_id == None)  # noqa: E711
+        )
+    )
+    return set(result.scalars().all())
+
+
+async def get_recipe_summaries(db: AsyncSession, household_id: str) -> list[Row]:
+    """Return the columns the recipe list shows for recipes visible to *household_id*.
+
+    Skips the ingredients/instructions JSON and the Recipe conversion, which
+    dominate the cost of get_recipes() but are not part of the listing.
+    """
+    result = await db.execute(
+        select(
+            RecipeModel.slug,
+            RecipeModel.name,
+            RecipeModel.servings,
+            RecipeModel.prep_time_minutes,
+            RecipeModel.cook_time_minutes,
+            RecipeModel.nutrition,
+            RecipeModel.tags,
+        ).where(
+            (RecipeModel.household_id == household_id) | (RecipeModel.household_id == None)  # noqa: E711
+        )
+    )
+    return list(result.all())
+
+
 async def get_recipe_by_id(
     db: AsyncSession, recipe_id: str
 ) -> Recipe | None:
@@ -0,0 +1,125 @@
+"""
+Exact-match cache for AI recipe extraction results.
+
+Re-importing the same caption or photo would otherwise pay a full GPT-4o
+round trip every time. Results are stored as JSON in a small SQLite file,
+keyed by a SHA-256 digest of everything that influences the model output
+(model name, prompt version, and the input itself).
+"""
+
+import hashlib
+import logging
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from app import config
+
+try:
+    import orjson
+
+    def _loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+except ImportError:
+    # Fall back to the stdlib encoder if orjson is not installed yet.
+    import json
+
+    _loads = json.loads
+    _dumps = json.dumps
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: str | bytes) -> str:
+    """Build a cache key from the parts that determine an extraction result."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else part)
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """SQLite-backed key → JSON cache.
+
+    Failures to read or write the cache are logged and otherwise ignored so
+    that a broken cache file never blocks an import.
+    """
+
+    def __init__(self, path: str | Path, max_age_days: int | None = None):
+        """
+        Initialize the cache, creating the backing table if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            max_age_days: Entries older than this are ignored and pruned on
+                start-up; None keeps them forever
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # SQLite datetime() modifier, e.g. "-30 days"
+        self._max_age = f"-{max_age_days} days" if max_age_days else None
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS extraction_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+            )
+            if self._max_age:
+                # Prompt edits rotate every key, so without pruning the file
+                # would keep entries that can never be hit again.
+                conn.execute(
+                    "DELETE FROM extraction_cache WHERE created_at < datetime('now', ?)",
+                    (self._max_age,),
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached value for *key*, or None on a miss."""
+        try:
+            with self._connect() as conn:
+                if self._max_age:
+                    row = conn.execute(
+                        "SELECT value FROM extraction_cache "
+                        "WHERE key = ? AND created_at >= datetime('now', ?)",
+                        (key, self._max_age),
+                    ).fetchone()
+                else:
+                    row = conn.execute(
+                        "SELECT value FROM extraction_cache WHERE key = ?", (key,)
+                    ).fetchone()
+        except sqlite3.Error:
+            logger.warning("Extraction cache read failed", exc_info=True)
+            return None
+        return _loads(row[0]) if row else None
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store *value* under *key*, replacing any existing entry."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO extraction_cache (key, value) VALUES (?, ?)",
+                    (key, _dumps(value)),
+                )
+        except sqlite3.Error:
+            logger.warning("Extraction cache write failed", exc_info=True)
+
+
+@lru_cache(maxsize=1)
+def get_extraction_cache() -> ExtractionCache | None:
+    """Return the shared cache, or None when EXTRACTION_CACHE_FILE is empty."""
+    if not config.EXTRACTION_CACHE_FILE:
+        return None
+    try:
+        return ExtractionCache(
+            config.EXTRACTION_CACHE_FILE, max_age_days=config.EXTRACTION_CACHE_MAX_AGE_DAYS
+        )
+    except (OSError, sqlite3.Error):
+        logger.warning("Extraction cache unavailable, continuing without it", exc_info=True)
+        return None
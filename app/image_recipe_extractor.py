@@ -1,15 +1,116 @@
 """Extract recipes from images using OpenAI Vision API."""
 
 import base64
+import hashlib
+import io
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 
 import openai
+from pydantic import BaseModel
+
+from app.extraction_cache import get_extraction_cache, make_cache_key
+from app.openai_client import get_openai_client
+
+try:
+    from PIL import Image
+except ImportError:
+    # Images are sent as-is if Pillow is not installed yet (e.g. before uv sync).
+    Image = None
 
 logger = logging.getLogger(__name__)
 
+# Text prompt sent alongside the image; the response shape is enforced by
+# ImageRecipeModel via Structured Outputs. Built once at import time and placed
+# before the image in the message so it forms a stable, cacheable prefix.
+# Avoid cosmetic edits: every change invalidates the cached prefix.
+_EXTRACTION_PROMPT = """Extract the recipe information from this image. Look for:
+- Recipe name
+- Number of servings
+- Preparation time
+- Cooking time
+- List of ingredients (with quantities, units, and items)
+- Step-by-step instructions
+- Any tags/categories (e.g., "dinner", "italian", "quick", "vegetarian")
+- Additional notes
+
+Important:
+- Extract ALL visible text carefully
+- Parse quantities and units separately
+- If handwritten, do your best to read it
+- If uncertain about a value, use your best guess but lower the confidence
+- For servings: If not specified, estimate based on ingredient quantities (default to 4 if unclear)
+- For times: Use null only if no time information is visible at all
+- Confidence: 0-1 (0.9+ high confidence, 0.7-0.9 medium, <0.7 low)"""
+
+_MODEL = "gpt-4o"  # gpt-4o has vision capabilities
+
+# Prompt-cache routing key; tied to the prompt hash so edits start a new cache.
+_PROMPT_CACHE_KEY = "image-recipe-extractor-" + hashlib.sha256(_EXTRACTION_PROMPT.encode()).hexdigest()[:16]
+
+
+class ImageIngredientModel(BaseModel):
+    """Structured Outputs schema for a single ingredient read from an image."""
+    quantity: float | None
+    unit: str
+    item: str
+    category: str
+
+
+class ImageRecipeModel(BaseModel):
+    """Structured Outputs schema for the Vision API response."""
+    name: str
+    servings: int | None
+    prep_time_minutes: int | None
+    cook_time_minutes: int | None
+    ingredients: list[ImageIngredientModel]
+    instructions: list[str]
+    tags: list[str]
+    notes: str | None
+    confidence: float
+
+
+# Large uploads are downscaled before encoding: recipe text stays legible well
+# below phone-camera resolution, and GPT-4o bills vision input per 512px tile.
+_MAX_IMAGE_EDGE = 1536
+_RESIZE_THRESHOLD_BYTES = 512_000
+_JPEG_QUALITY = 85
+
 
-@dataclass
+def _prepare_image(image_data: bytes, image_format: str) -> tuple[bytes, str]:
+    """Downscale and re-encode large images before upload.
+
+    Args:
+        image_data: Image bytes as uploaded
+        image_format: Image format (jpeg, png, etc.)
+
+    Returns:
+        (image_data, image_format) tuple to send to the Vision API.
+        The input is returned untouched if it is already small or cannot be
+        decoded.
+    """
+    if Image is None:
+        return image_data, image_format
+
+    try:
+        with Image.open(io.BytesIO(image_data)) as img:
+            if len(image_data) > _RESIZE_THRESHOLD_BYTES or max(img.size) > _MAX_IMAGE_EDGE:
+                img.thumbnail((_MAX_IMAGE_EDGE, _MAX_IMAGE_EDGE), Image.Resampling.LANCZOS)
+                buf = io.BytesIO()
+                img.convert("RGB").save(buf, "JPEG", quality=_JPEG_QUALITY, optimize=True)
+                logger.debug(
+                    "Image downscaled before upload",
+                    extra={"original_bytes": len(image_data), "resized_bytes": buf.tell(), "size": img.size},
+                )
+                image_data, image_format = buf.getvalue(), "jpeg"
+    except (OSError, Image.DecompressionBombError):
+        logger.warning("Could not decode image for resizing, sending original", exc_info=True)
+
+    return image_data, image_format
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ImageRecipeData:
     """Recipe data extracted from an image."""
     name: str
@@ -28,7 +129,8 @@ class ImageRecipeExtractor:
 
     def __init__(self, api_key: str):
         """Initialize the extractor with OpenAI API key."""
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
+        self.cache = get_extraction_cache()
 
     def extract_recipe(self, image_data: bytes, image_format: str = "jpeg") -> ImageRecipeData:
         """Extract recipe from image using GPT-4 Vision.
@@ -45,44 +147,54 @@ class ImageRecipeExtractor:
         """
         logger.info("Starting image recipe extraction", extra={"size_bytes": len(image_data), "image_format": image_format})
 
+        cache_key = make_cache_key(_MODEL, _PROMPT_CACHE_KEY, image_data)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Image recipe extraction served from cache", extra={"recipe_name": cached.get("name")})
+                return ImageRecipeData(**cached)
+
+        image_data, image_format = _prepare_image(image_data, image_format)
+
         # Encode image to base64
         try:
-            logger.debug("Encoding image to base64")
-            base64_image = base64.b64encode(image_data).decode('utf-8')
-            image_url = f"data:image/{image_format};base64,{base64_image}"
-            logger.debug("Image base64 encoded", extra={"base64_length": len(base64_image)})
+            # Build the data URL in one expression so no named intermediate
+            # keeps the base64 buffer alive during the (slow) API call.
+            image_url = "data:image/" + image_format + ";base64," + base64.b64encode(image_data).decode("ascii")
+            del image_data
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Image base64 encoded", extra={"data_url_length": len(image_url)})
         except Exception as e:
             logger.exception("Failed to encode image to base64", extra={"image_format": image_format})
             raise ValueError(f"Failed to encode image: {e}") from e
 
-        # Create prompt for recipe extraction
-        prompt = self._build_extraction_prompt()
-
-        import time
         try:
             # Call GPT-4 Vision API with a specific timeout
-            logger.info("Calling OpenAI Vision API", extra={"model": "gpt-4o", "timeout_s": 90})
+            logger.info("Calling OpenAI Vision API", extra={"model": _MODEL, "timeout_s": 90})
             t0 = time.monotonic()
-            response = self.client.chat.completions.create(
-                model="gpt-4o",  # gpt-4o has vision capabilities
+            response = self.client.chat.completions.parse(
+                model=_MODEL,
                 messages=[
                     {
                         "role": "user",
                         "content": [
                             {
                                 "type": "text",
-                                "text": prompt
+                                "text": _EXTRACTION_PROMPT
                             },
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": image_url
+                                    "url": image_url,
+                                    "detail": "auto"
                                 }
                             }
                         ]
                     }
                 ],
-                max_tokens=2000,
+                response_format=ImageRecipeModel,
+                prompt_cache_key=_PROMPT_CACHE_KEY,
+                max_tokens=1200,  # Caps worst-case decode time; a recipe rarely exceeds ~900
                 temperature=0.1,  # Low temperature for consistent extraction
                 timeout=90.0      # Explicit timeout for the API call
             )
@@ -90,11 +202,16 @@ class ImageRecipeExtractor:
             logger.info("OpenAI Vision API call successful", extra={"elapsed_s": elapsed})
 
             # Parse response
-            content = response.choices[0].message.content
-            logger.debug("Vision API response received", extra={"response_length": len(content)})
+            message = response.choices[0].message
+            if message.parsed is None:
+                raise ValueError(
+                    f"Vision API declined to extract a recipe: {message.refusal or 'no content returned'}"
+                )
 
-            result = self._parse_response(content)
+            result = self._parse_response(message.parsed)
             logger.info("Image recipe extraction complete", extra={"recipe_name": result.name, "confidence": result.confidence})
+            if self.cache is not None:
+                self.cache.set(cache_key, asdict(result))
             return result
 
         except openai.APIError as e:
@@ -113,110 +230,31 @@ class ImageRecipeExtractor:
             logger.exception("Unexpected error during image extraction")
             raise ValueError(f"Failed to extract recipe from image: {e}") from e
 
-    def _build_extraction_prompt(self) -> str:
-        """Build the prompt for recipe extraction."""
-        return """Extract the recipe information from this image. Look for:
-- Recipe name
-- Number of servings
-- Preparation time
-- Cooking time
-- List of ingredients (with quantities, units, and items)
-- Step-by-step instructions
-- Any tags/categories (e.g., "dinner", "italian", "quick", "vegetarian")
-- Additional notes
-
-Format your response EXACTLY as JSON with this structure:
-{
-  "name": "Recipe Name",
-  "servings": 4,
-  "prep_time_minutes": 15,
-  "cook_time_minutes": 30,
-  "ingredients": [
-    {"quantity": 2, "unit": "cups", "item": "flour", "category": "grains"},
-    {"quantity": 1, "unit": "tsp", "item": "salt", "category": "spices"}
-  ],
-  "instructions": [
-    "Step 1: Do this",
-    "Step 2: Do that"
-  ],
-  "tags": ["dinner", "italian"],
-  "notes": "Any additional notes or tips",
-  "confidence": 0.95
-}
-
-Important:
-- Extract ALL visible text carefully
-- Parse quantities and units separately
-- If handwritten, do your best to read it
-- If uncertain about a value, use your best guess but lower the confidence
-- For servings: If not specified, estimate based on ingredient quantities (default to 4 if unclear)
-- For times: Use null only if no time information is visible at all
-- Confidence: 0-1 (0.9+ high confidence, 0.7-0.9 medium, <0.7 low)
-- Return ONLY the JSON, no other text"""
-
-    def _parse_response(self, content: str) -> ImageRecipeData:
-        """Parse the API response into ImageRecipeData.
+    def _parse_response(self, parsed: ImageRecipeModel) -> ImageRecipeData:
+        """Convert the schema-validated API response into ImageRecipeData.
 
         Args:
-            content: JSON response from API
+            parsed: Structured Outputs model returned by the API
 
         Returns:
             ImageRecipeData object
         """
-        import json
-
-        logger.debug("Parsing image extraction response")
+        # Handle null servings by defaulting to 4
+        servings = parsed.servings
+        if servings is None:
+            logger.warning("Servings is null in image extraction response, defaulting to 4")
+            servings = 4
 
-        # Extract JSON from response (handles markdown code blocks)
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-
-        try:
-            import json
-            data = json.loads(content)
-            logger.debug("Image extraction JSON parsed", extra={"keys": list(data.keys())})
-        except json.JSONDecodeError as e:
-            logger.exception("JSON decode error parsing image extraction response", extra={"content_preview": content[:200]})
-            raise ValueError(f"Failed to parse JSON response: {e}") from e
-
-        # Validate required fields
-        required_fields = ["name", "servings", "ingredients", "instructions"]
-        for field in required_fields:
-            if field not in data:
-                logger.error("Missing required field in image extraction response", extra={"missing_field": field, "available_fields": list(data.keys())})
-                raise ValueError(f"Missing required field: {field}")
-
-        logger.debug("All required fields present in image extraction response")
-
-        # Create ImageRecipeData object
-        try:
-            # Handle null servings by defaulting to 4
-            servings = data.get("servings")
-            if servings is None:
-                logger.warning("Servings is null in image extraction response, defaulting to 4")
-                servings = 4
-            else:
-                servings = int(servings)
-
-            result = ImageRecipeData(
-                name=data["name"],
-                servings=servings,
-                prep_time_minutes=data.get("prep_time_minutes"),
-                cook_time_minutes=data.get("cook_time_minutes"),
-                ingredients=data["ingredients"],
-                instructions=data["instructions"],
-                tags=data.get("tags", []),
-                notes=data.get("notes"),
-                confidence=float(data.get("confidence", 0.8))
-            )
-            logger.debug("ImageRecipeData created", extra={"recipe_name": result.name})
-            return result
-        except Exception as e:
-            logger.exception("Failed to create ImageRecipeData object")
-            raise ValueError(f"Failed to create recipe data object: {e}") from e
+        result = ImageRecipeData(
+            name=parsed.name,
+            servings=servings,
+            prep_time_minutes=parsed.prep_time_minutes,
+            cook_time_minutes=parsed.cook_time_minutes,
+            ingredients=[ingredient.model_dump() for ingredient in parsed.ingredients],
+            instructions=parsed.instructions,
+            tags=parsed.tags,
+            notes=parsed.notes,
+            confidence=parsed.confidence,
+        )
+        logger.debug("ImageRecipeData created", extra={"recipe_name": result.name})
+        return result
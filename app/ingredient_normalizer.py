@@ -5,23 +5,29 @@ Standardizes units, handles fractions, and infers categories for ingredients.
 """
 
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+from app.category_keywords import CATEGORY_KEYWORDS
+
 logger = logging.getLogger(__name__)
 
-# Bilingual unit mapping (English and French)
-UNIT_MAPPING = {
+# Bilingual unit mapping (English and French). Keys are lowercase because
+# lookups are case-insensitive: 'T' (tbsp) and 't' (tsp) cannot both be
+# honoured, so a bare 't' reads as tsp.
+UNIT_MAPPING: MappingProxyType[str, str] = MappingProxyType({
     # Volume - English
     'cup': 'cup', 'cups': 'cup', 'c': 'cup', 'c.': 'cup',
-    'tablespoon': 'tbsp', 'tablespoons': 'tbsp', 'tbsp': 'tbsp', 'tbs': 'tbsp', 'T': 'tbsp',
+    'tablespoon': 'tbsp', 'tablespoons': 'tbsp', 'tbsp': 'tbsp', 'tbs': 'tbsp',
     'teaspoon': 'tsp', 'teaspoons': 'tsp', 'tsp': 'tsp', 't': 'tsp',
     'fluid ounce': 'fl oz', 'fluid ounces': 'fl oz', 'fl oz': 'fl oz', 'fl. oz.': 'fl oz',
     'pint': 'pint', 'pints': 'pint', 'pt': 'pint',
     'quart': 'quart', 'quarts': 'quart', 'qt': 'quart',
     'gallon': 'gallon', 'gallons': 'gallon', 'gal': 'gallon',
-    'milliliter': 'ml', 'milliliters': 'ml', 'ml': 'ml', 'mL': 'ml',
-    'liter': 'L', 'liters': 'L', 'l': 'L', 'L': 'L',
-    'deciliter': 'dl', 'deciliters': 'dl', 'dl': 'dl', 'dL': 'dl',
+    'milliliter': 'ml', 'milliliters': 'ml', 'ml': 'ml',
+    'liter': 'L', 'liters': 'L', 'l': 'L',
+    'deciliter': 'dl', 'deciliters': 'dl', 'dl': 'dl',
 
     # Volume - French
     'tasse': 'cup', 'tasses': 'cup',
@@ -69,93 +75,53 @@ UNIT_MAPPING = {
     'paquet': 'package', 'paquets': 'package',
     'pincée': 'pinch', 'pincées': 'pinch',
     'au goût': 'to taste',
-}
-
-# Category keywords for ingredient classification
-CATEGORY_KEYWORDS = {
-    'meat': [
-        'chicken', 'beef', 'pork', 'lamb', 'turkey', 'duck', 'veal', 'sausage',
-        'bacon', 'ham', 'prosciutto', 'salami', 'pepperoni', 'ground beef',
-        'ground pork', 'ground turkey', 'steak', 'chop', 'tenderloin', 'breast',
-        'thigh', 'wing', 'ribs', 'brisket', 'pancetta', 'chorizo',
-        # French
-        'poulet', 'bœuf', 'porc', 'agneau', 'dinde', 'canard', 'veau',
-        'saucisse', 'lard', 'jambon', 'viande', 'côtelette', 'filet',
-    ],
-    'seafood': [
-        'fish', 'salmon', 'tuna', 'cod', 'tilapia', 'halibut', 'trout', 'bass',
-        'shrimp', 'prawns', 'crab', 'lobster', 'scallops', 'clams', 'mussels',
-        'oysters', 'squid', 'octopus', 'anchovies', 'sardines',
-        # French
-        'poisson', 'saumon', 'thon', 'morue', 'truite', 'crevette', 'crevettes',
-        'crabe', 'homard', 'pétoncles', 'moules', 'huîtres', 'calamar',
-    ],
-    'produce': [
-        'tomato', 'onion', 'garlic', 'carrot', 'celery', 'potato', 'pepper',
-        'bell pepper', 'jalapeño', 'chili', 'cucumber', 'lettuce', 'spinach',
-        'kale', 'cabbage', 'broccoli', 'cauliflower', 'zucchini', 'eggplant',
-        'mushroom', 'corn', 'peas', 'green beans', 'asparagus', 'artichoke',
-        'avocado', 'apple', 'banana', 'orange', 'lemon', 'lime', 'strawberry',
-        'blueberry', 'raspberry', 'mango', 'pineapple', 'peach', 'pear',
-        'cherry', 'grape', 'watermelon', 'melon', 'ginger', 'herb', 'parsley',
-        'cilantro', 'basil', 'thyme', 'rosemary', 'oregano', 'mint', 'dill',
-        # French
-        'tomate', 'oignon', 'ail', 'carotte', 'céleri', 'pomme de terre',
-        'poivron', 'concombre', 'laitue', 'épinards', 'chou', 'brocoli',
-        'courgette', 'aubergine', 'champignon', 'maïs', 'petits pois',
-        'asperge', 'avocat', 'pomme', 'banane', 'citron', 'fraise', 'mangue',
-        'ananas', 'pêche', 'poire', 'cerise', 'raisin', 'melon', 'gingembre',
-        'persil', 'basilic', 'thym', 'romarin', 'origan', 'menthe',
-    ],
-    'dairy': [
-        'milk', 'cream', 'heavy cream', 'sour cream', 'half and half',
-        'butter', 'cheese', 'cheddar', 'mozzarella', 'parmesan', 'feta',
-        'ricotta', 'cream cheese', 'cottage cheese', 'goat cheese', 'brie',
-        'swiss', 'provolone', 'gouda', 'yogurt', 'greek yogurt', 'egg', 'eggs',
-        # French
-        'lait', 'crème', 'crème fraîche', 'beurre', 'fromage', 'parmesan',
-        'mozzarella', 'feta', 'ricotta', 'chèvre', 'gruyère', 'yaourt', 'œuf', 'œufs',
-    ],
-    'grains': [
-        'pasta', 'spaghetti', 'penne', 'rigatoni', 'fettuccine', 'linguine',
-        'macaroni', 'noodles', 'rice', 'basmati', 'jasmine', 'arborio', 'wild rice',
-        'quinoa', 'couscous', 'bulgur', 'barley', 'oats', 'bread', 'baguette',
-        'roll', 'bun', 'tortilla', 'pita', 'naan', 'flour', 'cornmeal', 'breadcrumbs',
-        # French
-        'pâtes', 'spaghetti', 'riz', 'quinoa', 'couscous', 'boulgour',
-        'avoine', 'pain', 'farine', 'chapelure',
-    ],
-    'spices': [
-        'salt', 'pepper', 'black pepper', 'white pepper', 'cayenne', 'paprika',
-        'cumin', 'coriander', 'turmeric', 'cinnamon', 'nutmeg', 'cloves',
-        'cardamom', 'bay leaf', 'chili powder', 'curry powder', 'garam masala',
-        'italian seasoning', 'herbs de provence', 'vanilla', 'extract',
-        'chipotle', 'ancho', 'smoked paprika', 'red pepper flakes',
-        # French
-        'sel', 'poivre', 'poivre noir', 'paprika', 'cumin', 'coriandre',
-        'curcuma', 'cannelle', 'muscade', 'clou de girofle', 'feuille de laurier',
-        'vanille', 'extrait',
-    ],
-    'pantry': [
-        'oil', 'olive oil', 'vegetable oil', 'coconut oil', 'sesame oil',
-        'vinegar', 'balsamic', 'wine vinegar', 'apple cider vinegar',
-        'soy sauce', 'fish sauce', 'worcestershire', 'hot sauce', 'sriracha',
-        'ketchup', 'mustard', 'mayo', 'mayonnaise', 'honey', 'maple syrup',
-        'sugar', 'brown sugar', 'powdered sugar', 'molasses', 'jam', 'jelly',
-        'peanut butter', 'tahini', 'stock', 'broth', 'bouillon', 'tomato paste',
-        'tomato sauce', 'coconut milk', 'condensed milk', 'evaporated milk',
-        'beans', 'chickpeas', 'lentils', 'kidney beans', 'black beans',
-        'white beans', 'pinto beans', 'nuts', 'almonds', 'walnuts', 'pecans',
-        'cashews', 'peanuts', 'pine nuts', 'seeds', 'sesame seeds', 'pumpkin seeds',
-        'beer', 'wine', 'dressing', 'cocoa', 'chocolate',
-        # French
-        'huile', "huile d'olive", 'vinaigre', 'vinaigre balsamique', 'sauce soja',
-        'miel', 'sirop', "sirop d'érable", 'sucre', 'sucre brun', 'confiture',
-        'beurre de cacahuète', 'bouillon', 'lait de coco', 'haricots',
-        'pois chiches', 'lentilles', 'noix', 'amandes', 'noix de cajou',
-        'graines', 'graines de sésame',
-    ],
-}
+})
+
+# Accented Latin letters → ASCII, so "creme fraiche" matches 'crème fraîche'
+# and "boite" matches 'boîte'. Applied after lower(), hence lowercase only.
+_ACCENT_FOLD = str.maketrans({
+    'à': 'a', 'á': 'a', 'â': 'a', 'ä': 'a',
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+    'í': 'i', 'î': 'i', 'ï': 'i',
+    'ó': 'o', 'ô': 'o', 'ö': 'o',
+    'ú': 'u', 'ù': 'u', 'û': 'u', 'ü': 'u',
+    'ç': 'c', 'ñ': 'n', 'ÿ': 'y',
+    'œ': 'oe', 'æ': 'ae',
+})
+
+
+def _fold(text: str) -> str:
+    """Lowercase *text* and strip accents for case/accent-insensitive matching."""
+    return text.lower().translate(_ACCENT_FOLD)
+
+
+# UNIT_MAPPING keyed by folded unit, plus a naive plural ("<unit>s") for every
+# entry that lacks one, so standardize_unit resolves any known unit with a
+# single lookup.
+_UNIT_LOOKUP_BASE = {_fold(unit): std for unit, std in UNIT_MAPPING.items()}
+_UNIT_LOOKUP: MappingProxyType[str, str] = MappingProxyType(
+    _UNIT_LOOKUP_BASE
+    | {unit + 's': std for unit, std in _UNIT_LOOKUP_BASE.items() if unit + 's' not in _UNIT_LOOKUP_BASE}
+)
+
+# Folded keyword → (priority, category) for infer_category. Priority is the
+# position in CATEGORY_KEYWORDS, so keywords listed under several categories
+# (e.g. 'pepper') resolve to the first one, and ties between equal-length
+# matches go to the keyword listed first.
+_KEYWORD_CATEGORIES: dict[str, tuple[int, str]] = {}
+for _category, _keywords in CATEGORY_KEYWORDS.items():
+    for _keyword in _keywords:
+        _KEYWORD_CATEGORIES.setdefault(_fold(_keyword), (len(_KEYWORD_CATEGORIES), _category))
+
+# Keywords bucketed by their first _PREFIX_LEN characters (the shortest keyword
+# length), longest first. infer_category slides over the item once and only
+# tests the handful of keywords that can start at each position instead of
+# running a substring search for every keyword.
+_PREFIX_LEN = min(len(kw) for kw in _KEYWORD_CATEGORIES)
+_KEYWORDS_BY_PREFIX: dict[str, tuple[str, ...]] = {}
+for _keyword in sorted(_KEYWORD_CATEGORIES, key=lambda kw: (-len(kw), _KEYWORD_CATEGORIES[kw][0])):
+    _prefix = _keyword[:_PREFIX_LEN]
+    _KEYWORDS_BY_PREFIX[_prefix] = _KEYWORDS_BY_PREFIX.get(_prefix, ()) + (_keyword,)
 
 # Valid canonical categories
 _VALID_CATEGORIES: frozenset[str] = frozenset(
@@ -163,7 +129,7 @@ _VALID_CATEGORIES: frozenset[str] = frozenset(
 )
 
 # Aliases → canonical category (covers common AI hallucinations and variant names)
-_CATEGORY_ALIASES: dict[str, str] = {
+_CATEGORY_ALIASES: MappingProxyType[str, str] = MappingProxyType({
     "spices and seasonings": "spices",
     "spice": "spices",
     "seasoning": "spices",
@@ -186,7 +152,14 @@ _CATEGORY_ALIASES: dict[str, str] = {
     "nuts and seeds": "pantry",
     "legumes": "pantry",
     "beans": "pantry",
-}
+})
+
+# Every accepted spelling → canonical category, so canonicalise_category does a
+# single lookup and always hands back the same (interned) canonical string
+# objects, never the freshly lowercased input.
+_CANONICAL_CATEGORIES: MappingProxyType[str, str] = MappingProxyType(
+    {category: category for category in _VALID_CATEGORIES} | _CATEGORY_ALIASES
+)
 
 
 def canonicalise_category(raw: str) -> str:
@@ -197,49 +170,71 @@ def canonicalise_category(raw: str) -> str:
     """
     if not raw:
         return "other"
-    normalised = raw.strip().lower()
-    if normalised in _VALID_CATEGORIES:
-        return normalised
-    if normalised in _CATEGORY_ALIASES:
-        return _CATEGORY_ALIASES[normalised]
+    # Try the value as given first: the AI almost always returns a clean
+    # lowercase category, which then needs no strip()/lower() copies.
+    canonical = _CANONICAL_CATEGORIES.get(raw) or _CANONICAL_CATEGORIES.get(raw.strip().lower())
+    if canonical is not None:
+        return canonical
     logger.warning("Unknown ingredient category %r — mapping to 'other'", raw)
     return "other"
 
 
-def normalize_ingredient(ai_ingredient: dict[str, Any]) -> dict[str, Any]:
+def _to_float(value: Any) -> float | None:
+    """Return *value* as a float, or None if it is missing or not numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def normalize_ingredient(ai_ingredient: dict[str, Any], *, copy: bool = True) -> dict[str, Any]:
     """
     Normalize AI-extracted ingredient.
 
     Args:
         ai_ingredient: Raw ingredient from AI ({"item": str, "quantity": float, "unit": str, "category": str})
+        copy: Work on a copy of *ai_ingredient*. Pass False when the caller
+            owns the dict and does not need the raw values afterwards.
 
     Returns:
-        Normalized ingredient dict
+        Normalized ingredient dict (*ai_ingredient* itself when copy is False)
     """
-    normalized = ai_ingredient.copy()
+    normalized = ai_ingredient.copy() if copy else ai_ingredient
 
     # Standardize unit
-    if 'unit' in normalized and normalized['unit']:
-        normalized['unit'] = standardize_unit(normalized['unit'])
+    unit = normalized.get('unit')
+    if unit:
+        normalized['unit'] = standardize_unit(unit)
 
     # Canonicalise whatever category the AI provided, then infer if still unknown
-    raw_category = normalized.get('category') or ''
-    normalized['category'] = canonicalise_category(raw_category)
-    if normalized['category'] == 'other':
-        item = normalized.get('item', '').lower()
-        normalized['category'] = infer_category(item)
+    category = canonicalise_category(normalized.get('category') or '')
+    if category == 'other':
+        category = infer_category(normalized.get('item', ''))
+    normalized['category'] = category
 
     # Handle quantity: ensure it's a number or None
     if 'quantity' in normalized:
-        try:
-            if normalized['quantity'] is not None:
-                normalized['quantity'] = float(normalized['quantity'])
-        except (ValueError, TypeError):
-            normalized['quantity'] = None
+        normalized['quantity'] = _to_float(normalized['quantity'])
 
     return normalized
 
 
+def normalize_ingredients(ai_ingredients: list[dict[str, Any]], *, copy: bool = True) -> list[dict[str, Any]]:
+    """
+    Normalize a list of AI-extracted ingredients.
+
+    Args:
+        ai_ingredients: Raw ingredients from AI
+        copy: See normalize_ingredient
+
+    Returns:
+        Normalized ingredient dicts, in the same order
+    """
+    return [normalize_ingredient(ingredient, copy=copy) for ingredient in ai_ingredients]
+
+
 def standardize_unit(unit: str) -> str:
     """
     Standardize unit across English and French.
@@ -253,25 +248,18 @@ def standardize_unit(unit: str) -> str:
     if not unit:
         return 'whole'
 
-    # Normalize: lowercase, strip whitespace
-    unit_lower = unit.lower().strip()
-
-    # Direct mapping
-    if unit_lower in UNIT_MAPPING:
-        return UNIT_MAPPING[unit_lower]
-
-    # Handle plural forms not in mapping
-    if unit_lower.endswith('s') and unit_lower[:-1] in UNIT_MAPPING:
-        return UNIT_MAPPING[unit_lower[:-1]]
-
-    # Return as-is if no mapping found
-    return unit
+    # Normalize: lowercase, strip accents and whitespace; return as-is if no mapping found
+    return _UNIT_LOOKUP.get(_fold(unit).strip(), unit)
 
 
+@lru_cache(maxsize=4096)
 def infer_category(item: str) -> str:
     """
     Infer ingredient category from item name.
 
+    Results are memoised: the same items ("salt", "olive oil") recur across
+    every recipe in a plan and every shopping list.
+
     Args:
         item: Ingredient name
 
@@ -281,18 +269,32 @@ def infer_category(item: str) -> str:
     if not item:
         return 'other'
 
-    item_lower = item.lower()
+    item_lower = _fold(item)
+
+    # Fast path: AI-extracted items are often exactly a keyword ("salt",
+    # "olive oil"), and no other keyword can be a longer match than that.
+    exact = _KEYWORD_CATEGORIES.get(item_lower)
+    if exact is not None:
+        return exact[1]
 
     # Use longest-match: a more specific keyword (longer string) takes priority
     # over a shorter one that happens to be a substring of the ingredient name.
     # e.g. "apple cider vinegar" matches 'apple cider vinegar' (pantry, 19 chars)
     # over 'apple' (produce, 5 chars).
-    best_category = 'other'
-    best_len = 0
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in item_lower and len(keyword) > best_len:
-                best_len = len(keyword)
-                best_category = category
-
-    return best_category
+    best_keyword = None
+    best_priority = 0
+    for start in range(len(item_lower) - _PREFIX_LEN + 1):
+        for keyword in _KEYWORDS_BY_PREFIX.get(item_lower[start:start + _PREFIX_LEN], ()):
+            if item_lower.startswith(keyword, start):
+                # Candidates are longest first, so only the first hit per
+                # position can improve on the best match so far.
+                priority = _KEYWORD_CATEGORIES[keyword][0]
+                if (
+                    best_keyword is None
+                    or len(keyword) > len(best_keyword)
+                    or (len(keyword) == len(best_keyword) and priority < best_priority)
+                ):
+                    best_keyword, best_priority = keyword, priority
+                break
+
+    return _KEYWORD_CATEGORIES[best_keyword][1] if best_keyword else 'other'
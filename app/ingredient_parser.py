@@ -3,6 +3,8 @@
 import re
 from dataclasses import dataclass
 
+from app.ingredient_normalizer import infer_category
+
 
 @dataclass
 class ParsedIngredient:
@@ -15,18 +17,25 @@ class ParsedIngredient:
 
 
 class IngredientParser:
-    """Parse ingredient strings into structured format."""
+    """Parse ingredient strings into structured format.
+
+    Stateless: all tables and regexes are immutable class attributes, so a
+    single instance (DEFAULT_PARSER) can be shared, including across threads.
+    """
+
+    # Unit sets hold lowercase spellings only; units are lowercased once when
+    # extracted, before any membership test.
 
     # Weight units (preferred)
-    WEIGHT_UNITS = {
+    WEIGHT_UNITS = frozenset({
         'g', 'gram', 'grams', 'kg', 'kilogram', 'kilograms',
         'oz', 'ounce', 'ounces', 'lb', 'lbs', 'pound', 'pounds'
-    }
+    })
 
     # Volume units
-    VOLUME_UNITS = {
+    VOLUME_UNITS = frozenset({
         'cup', 'cups', 'c',
-        'tbsp', 'tablespoon', 'tablespoons', 'tbs', 'T',
+        'tbsp', 'tablespoon', 'tablespoons', 'tbs',
         'tsp', 'teaspoon', 'teaspoons',
         'ml', 'milliliter', 'milliliters',
         'l', 'liter', 'liters',
@@ -34,80 +43,14 @@ class IngredientParser:
         'pint', 'pints', 'pt',
         'quart', 'quarts', 'qt',
         'gallon', 'gallons', 'gal'
-    }
+    })
 
     # Count units
-    COUNT_UNITS = {
+    COUNT_UNITS = frozenset({
         'whole', 'piece', 'pieces', 'clove', 'cloves',
         'slice', 'slices', 'can', 'cans', 'package', 'packages',
         'bunch', 'bunches', 'head', 'heads', 'stalk', 'stalks'
-    }
-
-    # Ingredient categorization
-    INGREDIENT_CATEGORIES = {
-        'meat': [
-            'beef', 'chicken', 'pork', 'turkey', 'lamb', 'veal', 'duck',
-            'bacon', 'sausage', 'ham', 'steak', 'ground beef', 'ground turkey',
-            'ground chicken', 'ground pork', 'meatball', 'meat'
-        ],
-        'produce': [
-            'onion', 'garlic', 'tomato', 'potato', 'carrot', 'celery',
-            'pepper', 'bell pepper', 'broccoli', 'spinach', 'lettuce',
-            'cucumber', 'zucchini', 'mushroom', 'corn', 'peas',
-            'green bean', 'cabbage', 'kale', 'apple', 'banana',
-            'lemon', 'lime', 'orange', 'berry', 'strawberry', 'blueberry',
-            'avocado', 'ginger', 'parsley', 'cilantro', 'basil',
-            'thyme', 'rosemary', 'dill', 'mint', 'scallion', 'shallot',
-            'leek', 'eggplant', 'squash', 'pumpkin', 'beet', 'radish',
-            'turnip', 'parsnip', 'asparagus', 'artichoke', 'brussels sprout',
-            'cauliflower', 'chard', 'arugula', 'watercress', 'endive',
-            'radicchio', 'fennel', 'okra', 'bok choy'
-        ],
-        'dairy': [
-            'milk', 'cream', 'butter', 'cheese', 'yogurt', 'sour cream',
-            'cream cheese', 'cottage cheese', 'ricotta', 'mozzarella',
-            'parmesan', 'cheddar', 'feta', 'goat cheese', 'swiss',
-            'provolone', 'brie', 'blue cheese', 'mascarpone', 'whipped cream',
-            'half and half', 'heavy cream', 'whipping cream', 'buttermilk',
-            'egg', 'eggs', 'egg white', 'egg yolk'
-        ],
-        'grains': [
-            'flour', 'bread', 'pasta', 'rice', 'oat', 'quinoa', 'barley',
-            'couscous', 'bulgur', 'farro', 'wheat', 'cornmeal', 'polenta',
-            'noodle', 'spaghetti', 'penne', 'tortilla', 'pita', 'bagel',
-            'roll', 'bun', 'cracker', 'breadcrumb', 'cereal', 'granola',
-            'cornstarch', 'corn starch'
-        ],
-        'pantry': [
-            'oil', 'olive oil', 'vegetable oil', 'coconut oil', 'canola oil',
-            'vinegar', 'balsamic', 'soy sauce', 'worcestershire',
-            'hot sauce', 'ketchup', 'mustard', 'mayonnaise', 'mayo',
-            'honey', 'maple syrup', 'syrup', 'molasses', 'agave',
-            'sugar', 'brown sugar', 'powdered sugar', 'confectioner',
-            'salt', 'pepper', 'black pepper', 'sea salt', 'kosher salt',
-            'stock', 'broth', 'bouillon', 'tomato paste', 'tomato sauce',
-            'salsa', 'beans', 'chickpea', 'lentil', 'kidney bean',
-            'black bean', 'pinto bean', 'white bean', 'cannellini',
-            'peanut butter', 'almond butter', 'tahini', 'nut', 'nuts',
-            'almond', 'walnut', 'pecan', 'cashew', 'pistachio', 'pine nut',
-            'peanut', 'hazelnut', 'macadamia', 'seed', 'sesame', 'sunflower',
-            'pumpkin seed', 'chia', 'flax', 'coconut', 'vanilla extract',
-            'vanilla', 'almond extract', 'baking powder', 'baking soda',
-            'yeast', 'gelatin', 'cocoa', 'chocolate', 'chocolate chip',
-            'raisin', 'dried fruit', 'date', 'fig', 'cranberry'
-        ],
-        'spices': [
-            'cumin', 'paprika', 'chili powder', 'cayenne', 'turmeric',
-            'coriander', 'cinnamon', 'nutmeg', 'clove', 'cardamom',
-            'allspice', 'ginger', 'garlic powder', 'onion powder',
-            'oregano', 'basil', 'thyme', 'rosemary', 'sage', 'bay leaf',
-            'dill', 'tarragon', 'marjoram', 'curry', 'garam masala',
-            'italian seasoning', 'herbes de provence', 'five spice',
-            'red pepper flake', 'crushed red pepper', 'sesame seed',
-            'poppy seed', 'mustard seed', 'celery seed', 'fennel seed',
-            'caraway', 'anise', 'saffron', 'vanilla bean', 'peppercorn'
-        ]
-    }
+    })
 
     # Common preparation words to separate from ingredient name
     PREPARATION_WORDS = [
@@ -122,6 +65,51 @@ class IngredientParser:
         'for garnish', 'if desired', 'as needed'
     ]
 
+    # Longest first so "season to taste" is tried before "to taste"
+    _PREP_WORDS_BY_LENGTH = tuple(sorted(PREPARATION_WORDS, key=len, reverse=True))
+    # Matches if any preparation word occurs in (lowercased) text, in one pass
+    _PREP_WORD_RE = re.compile('|'.join(map(re.escape, _PREP_WORDS_BY_LENGTH)))
+
+    # Unicode fraction characters → value
+    _UNICODE_FRACTIONS = {
+        '¼': 0.25, '½': 0.5, '¾': 0.75,
+        '⅓': 0.333, '⅔': 0.667,
+        '⅛': 0.125, '⅜': 0.375, '⅝': 0.625, '⅞': 0.875
+    }
+    # Optional whole number followed by a unicode fraction: "¼", "1½"
+    _UNICODE_QUANTITY_RE = re.compile(r'(\d*)([¼½¾⅓⅔⅛⅜⅝⅞])')
+
+    # Measurement: number + optional fraction + unit, as one alternation so the
+    # text is scanned once, left to right. Alternatives are tried in order at
+    # each position, so "1 1/2 cups" is read as a mixed number, not "2 cups".
+    # Handles: "1 cup", "120 g", "1/4 tsp", "1 1/2 cups", "¼ cup", "1½ cups"
+    _MEASUREMENT_RE = re.compile(
+        r'(?P<quantity>'
+        r'\d+\s+\d+/\d+'          # Mixed number: "1 1/2"
+        r'|\d+[¼½¾⅓⅔⅛⅜⅝⅞]'        # Integer + unicode fraction: "1½"
+        r'|\d+/\d+'                # Standard fraction: "1/4"
+        r'|[¼½¾⅓⅔⅛⅜⅝⅞]'            # Just unicode fraction: "¼"
+        r'|[\d.]+'                 # Decimal or integer: "120", "1.5"
+        r')\s*(?P<unit>[a-zA-Z]+)',
+        re.IGNORECASE,
+    )
+
+    # Clean-up patterns for _extract_item_and_notes
+    _PAREN_MEASUREMENT_RE = re.compile(r'\s*\([^)]*[\d¼½¾⅓⅔⅛⅜⅝⅞][^)]*\)')
+    _LEADING_MEASUREMENT_RE = re.compile(r'^\s*[\d¼½¾⅓⅔⅛⅜⅝⅞./\s]+[a-zA-Z]+\.?\s+')
+    # Any known unit at the start, optionally followed by a period. Longest
+    # first so "tablespoon" wins over "tbsp"-like prefixes.
+    _LEADING_UNIT_RE = re.compile(
+        r'^\s*(?:'
+        + '|'.join(map(re.escape, sorted(WEIGHT_UNITS | VOLUME_UNITS | COUNT_UNITS, key=lambda u: (-len(u), u))))
+        + r')\.?\s+',
+        re.IGNORECASE,
+    )
+    _LEADING_QUANTITY_RE = re.compile(r'^\s*\d+\s+')
+    _LEADING_FRACTION_RE = re.compile(r'^\s*[¼½¾⅓⅔⅛⅜⅝⅞]\s+')
+    _TRAILING_CONJUNCTION_RE = re.compile(r'\s+(and|or)\s*$', re.IGNORECASE)
+    _PIPE_PAREN_RE = re.compile(r'[|()]')
+
     def parse(self, ingredient_str: str) -> ParsedIngredient:
         """Parse ingredient string into structured format.
 
@@ -155,30 +143,16 @@ class IngredientParser:
     def _extract_measurements(self, text: str) -> list[tuple[float, str]]:
         """Extract all measurements from text.
 
-        Returns list of (quantity, unit) tuples.
+        Returns list of (quantity, unit) tuples in the order they appear.
         """
         measurements = []
 
-        # Pattern: number + optional fraction + unit
-        # Handles: "1 cup", "120 g", "1/4 tsp", "1 1/2 cups", "¼ cup", "1½ cups"
-        patterns = [
-            # Integer + unicode fraction: "1½"
-            r'(\d+[¼½¾⅓⅔⅛⅜⅝⅞])\s*([a-zA-Z]+)',
-            # Just unicode fraction: "¼"
-            r'([¼½¾⅓⅔⅛⅜⅝⅞])\s*([a-zA-Z]+)',
-            # Standard fractions: "1/4", "1 1/2"
-            r'(\d+\s+\d+/\d+)\s*([a-zA-Z]+)',
-            r'(\d+/\d+)\s*([a-zA-Z]+)',
-            # Decimal or integer: "120 g", "1.5 cups"
-            r'([\d.]+)\s*([a-zA-Z]+)',
-        ]
-
-        for pattern in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                quantity_str, unit = match.groups()
-                quantity = self._parse_quantity(quantity_str)
-                if quantity and self._is_valid_unit(unit):
-                    measurements.append((quantity, unit.lower()))
+        for match in self._MEASUREMENT_RE.finditer(text):
+            quantity_str, unit = match.groups()
+            quantity = self._parse_quantity(quantity_str)
+            unit = unit.lower()
+            if quantity and self._is_valid_unit(unit):
+                measurements.append((quantity, unit))
 
         return measurements
 
@@ -189,30 +163,11 @@ class IngredientParser:
         """
         quantity_str = quantity_str.strip()
 
-        # Unicode fractions
-        unicode_fractions = {
-            '¼': 0.25, '½': 0.5, '¾': 0.75,
-            '⅓': 0.333, '⅔': 0.667,
-            '⅛': 0.125, '⅜': 0.375, '⅝': 0.625, '⅞': 0.875
-        }
-
-        # Check for integer + unicode fraction: "1½"
-        for frac_char, frac_value in unicode_fractions.items():
-            if frac_char in quantity_str:
-                # Split on the fraction character
-                parts = quantity_str.split(frac_char)
-                if parts[0]:  # There's a whole number before the fraction
-                    try:
-                        whole = float(parts[0])
-                        return whole + frac_value
-                    except ValueError:
-                        pass
-                else:  # Just the fraction
-                    return frac_value
-
-        # Just unicode fraction
-        if quantity_str in unicode_fractions:
-            return unicode_fractions[quantity_str]
+        # Unicode fraction, optionally after an integer: "¼", "1½"
+        unicode_match = self._UNICODE_QUANTITY_RE.fullmatch(quantity_str)
+        if unicode_match:
+            whole_str, frac_char = unicode_match.groups()
+            return int(whole_str or 0) + self._UNICODE_FRACTIONS[frac_char]
 
         # Mixed number: "1 1/2"
         if ' ' in quantity_str and '/' in quantity_str:
@@ -236,12 +191,11 @@ class IngredientParser:
             return None
 
     def _is_valid_unit(self, unit: str) -> bool:
-        """Check if unit is a recognized measurement unit."""
-        unit_lower = unit.lower()
+        """Check if a lowercase unit is a recognized measurement unit."""
         return (
-            unit_lower in self.WEIGHT_UNITS or
-            unit_lower in self.VOLUME_UNITS or
-            unit_lower in self.COUNT_UNITS
+            unit in self.WEIGHT_UNITS or
+            unit in self.VOLUME_UNITS or
+            unit in self.COUNT_UNITS
         )
 
     def _select_best_measurement(self, measurements: list[tuple[float, str]]) -> tuple[float, str]:
@@ -252,29 +206,16 @@ class IngredientParser:
         if not measurements:
             return (1.0, 'serving')
 
-        # Separate by type
-        weight_measurements = [
-            (q, u) for q, u in measurements
-            if u.lower() in self.WEIGHT_UNITS
-        ]
-        volume_measurements = [
-            (q, u) for q, u in measurements
-            if u.lower() in self.VOLUME_UNITS
-        ]
-        count_measurements = [
-            (q, u) for q, u in measurements
-            if u.lower() in self.COUNT_UNITS
-        ]
-
-        # Prefer weight, then volume, then count
-        if weight_measurements:
-            return weight_measurements[0]
-        elif volume_measurements:
-            return volume_measurements[0]
-        elif count_measurements:
-            return count_measurements[0]
-        else:
-            return measurements[0]
+        # Prefer weight, then volume, then count; first one of the best kind wins
+        best = measurements[0]
+        best_rank = 0
+        for quantity, unit in measurements:
+            if unit in self.WEIGHT_UNITS:
+                return (quantity, unit)
+            rank = 2 if unit in self.VOLUME_UNITS else 1 if unit in self.COUNT_UNITS else 0
+            if rank > best_rank:
+                best, best_rank = (quantity, unit), rank
+        return best
 
     def _extract_item_and_notes(self, text: str) -> tuple[str, str | None]:
         """Extract ingredient name and separate preparation notes.
@@ -290,27 +231,20 @@ class IngredientParser:
 
         # Remove parenthetical measurements: "(1 cup | 120 g)", "(¾ tsp)", etc.
         # This regex matches parentheses containing numbers, fractions, or units
-        clean_text = re.sub(r'\s*\([^)]*[\d¼½¾⅓⅔⅛⅜⅝⅞][^)]*\)', '', clean_text)
+        clean_text = self._PAREN_MEASUREMENT_RE.sub('', clean_text)
 
         # Remove leading measurements: "2 cups", "120 g", "1/4 tsp", "1½ tsp"
-        clean_text = re.sub(r'^\s*[\d¼½¾⅓⅔⅛⅜⅝⅞./\s]+[a-zA-Z]+\.?\s+', '', clean_text)
-
-        # Remove leading unit without number: "Tbsp. ", "Tsp. ", etc.
-        all_units = list(self.WEIGHT_UNITS) + list(self.VOLUME_UNITS) + list(self.COUNT_UNITS)
-        # Sort by length (longest first) to match "tablespoon" before "tbsp"
-        all_units_sorted = sorted(all_units, key=len, reverse=True)
-        for unit in all_units_sorted:
-            # Case-insensitive match for unit at start, optionally followed by period
-            pattern = rf'^\s*{re.escape(unit)}\.?\s+'
-            clean_text = re.sub(pattern, '', clean_text, flags=re.IGNORECASE)
-            if clean_text != text:  # If we made a change, we're done
-                break
+        # Otherwise remove a leading unit without number: "Tbsp. ", "Tsp. ",
+        # etc. Never both, so "1 cup whole milk" keeps "whole".
+        clean_text, stripped = self._LEADING_MEASUREMENT_RE.subn('', clean_text)
+        if not stripped:
+            clean_text = self._LEADING_UNIT_RE.sub('', clean_text, count=1)
 
         # Remove leading quantity without unit: "2 large eggs" → "large eggs"
-        clean_text = re.sub(r'^\s*\d+\s+', '', clean_text)
+        clean_text = self._LEADING_QUANTITY_RE.sub('', clean_text)
 
         # Remove leading unicode fraction without unit: "½ teaspoon" → "teaspoon"
-        clean_text = re.sub(r'^\s*[¼½¾⅓⅔⅛⅜⅝⅞]\s+', '', clean_text)
+        clean_text = self._LEADING_FRACTION_RE.sub('', clean_text)
 
         clean_text = clean_text.strip()
 
@@ -326,7 +260,7 @@ class IngredientParser:
                 potential_notes = parts[1].strip().rstrip(')')
 
                 # Check if the second part contains preparation words
-                if any(word in potential_notes.lower() for word in self.PREPARATION_WORDS):
+                if self._PREP_WORD_RE.search(potential_notes.lower()):
                     item = potential_item
                     notes = potential_notes
                     break
@@ -334,38 +268,30 @@ class IngredientParser:
         # If no separator found, check for preparation words without separators
         # Example: "Lawry's Seasoned Salt season to taste"
         # Sort by length (longest first) to match "season to taste" before "to taste"
-        if notes is None:
-            prep_words_sorted = sorted(self.PREPARATION_WORDS, key=len, reverse=True)
-            for prep_word in prep_words_sorted:
-                if prep_word in clean_text.lower():
-                    # Find where the prep word starts
-                    idx = clean_text.lower().find(prep_word)
-                    if idx > 0:  # Not at the very start
-                        item = clean_text[:idx].strip()
-                        notes = clean_text[idx:].strip().rstrip(')')
-                        break
+        clean_lower = clean_text.lower()
+        if notes is None and self._PREP_WORD_RE.search(clean_lower):
+            for prep_word in self._PREP_WORDS_BY_LENGTH:
+                # Find where the prep word starts
+                idx = clean_lower.find(prep_word)
+                if idx > 0:  # Not at the very start
+                    item = clean_text[:idx].strip()
+                    notes = clean_text[idx:].strip().rstrip(')')
+                    break
 
         # Clean up item name
         item = item.strip()
 
         # Remove trailing "and" or "or"
-        item = re.sub(r'\s+(and|or)\s*$', '', item, flags=re.IGNORECASE)
+        item = self._TRAILING_CONJUNCTION_RE.sub('', item)
 
         # Remove any remaining parentheses or pipes
-        item = re.sub(r'[|()]', '', item).strip()
+        item = self._PIPE_PAREN_RE.sub('', item).strip()
 
         return (item, notes)
 
     def _categorize(self, item: str) -> str:
         """Categorize ingredient based on name."""
-        item_lower = item.lower()
-
-        for category, keywords in self.INGREDIENT_CATEGORIES.items():
-            for keyword in keywords:
-                if keyword in item_lower:
-                    return category
-
-        return 'other'
+        return infer_category(item)
 
     def to_dict(self, parsed: ParsedIngredient) -> dict:
         """Convert ParsedIngredient to dict format."""
@@ -378,3 +304,7 @@ class IngredientParser:
         if parsed.notes:
             result['notes'] = parsed.notes
         return result
+
+
+# Shared instance; prefer it over constructing a parser per call.
+DEFAULT_PARSER = IngredientParser()
@@ -1,172 +1,189 @@
 """Ingredient substitution suggestions for meal planning flexibility."""
 
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import pairwise
+from types import MappingProxyType
 
-# Comprehensive ingredient substitution database
-SUBSTITUTIONS = {
+
+@dataclass(slots=True, frozen=True)
+class Substitution:
+    """One substitute for an ingredient."""
+    substitute: str
+    ratio: str
+    note: str
+
+
+# Comprehensive ingredient substitution database (read-only)
+SUBSTITUTIONS: MappingProxyType[str, tuple[Substitution, ...]] = MappingProxyType({
     # Dairy
-    "milk": [
-        {"substitute": "almond milk", "ratio": "1:1", "note": "Best for most recipes"},
-        {"substitute": "soy milk", "ratio": "1:1", "note": "Higher protein content"},
-        {"substitute": "oat milk", "ratio": "1:1", "note": "Creamy texture"},
-        {"substitute": "coconut milk", "ratio": "1:1", "note": "Rich, tropical flavor"},
-    ],
-    "butter": [
-        {"substitute": "coconut oil", "ratio": "1:1", "note": "For baking and cooking"},
-        {"substitute": "olive oil", "ratio": "3/4 cup oil per 1 cup butter", "note": "For savory dishes"},
-        {"substitute": "margarine", "ratio": "1:1", "note": "Vegan option"},
-        {"substitute": "applesauce", "ratio": "1/2 cup per 1 cup butter", "note": "For baking, reduces fat"},
-    ],
-    "heavy cream": [
-        {"substitute": "coconut cream", "ratio": "1:1", "note": "Vegan, rich texture"},
-        {"substitute": "cashew cream", "ratio": "1:1", "note": "Blend cashews with water"},
-        {"substitute": "milk + butter", "ratio": "1 cup milk + 2 tbsp butter", "note": "Mix together"},
-    ],
-    "sour cream": [
-        {"substitute": "greek yogurt", "ratio": "1:1", "note": "Higher protein"},
-        {"substitute": "coconut cream", "ratio": "1:1", "note": "Vegan option"},
-        {"substitute": "cashew cream", "ratio": "1:1", "note": "Blend with lemon juice"},
-    ],
-    "cream cheese": [
-        {"substitute": "greek yogurt", "ratio": "1:1", "note": "Lighter option"},
-        {"substitute": "cottage cheese", "ratio": "Blend until smooth", "note": "Lower fat"},
-        {"substitute": "silken tofu", "ratio": "Blend with lemon juice", "note": "Vegan option"},
-    ],
-    "parmesan cheese": [
-        {"substitute": "pecorino romano", "ratio": "1:1", "note": "Sharper flavor"},
-        {"substitute": "nutritional yeast", "ratio": "2:1", "note": "Vegan, nutty flavor"},
-        {"substitute": "asiago cheese", "ratio": "1:1", "note": "Milder taste"},
-    ],
+    "milk": (
+        Substitution("almond milk", "1:1", "Best for most recipes"),
+        Substitution("soy milk", "1:1", "Higher protein content"),
+        Substitution("oat milk", "1:1", "Creamy texture"),
+        Substitution("coconut milk", "1:1", "Rich, tropical flavor"),
+    ),
+    "butter": (
+        Substitution("coconut oil", "1:1", "For baking and cooking"),
+        Substitution("olive oil", "3/4 cup oil per 1 cup butter", "For savory dishes"),
+        Substitution("margarine", "1:1", "Vegan option"),
+        Substitution("applesauce", "1/2 cup per 1 cup butter", "For baking, reduces fat"),
+    ),
+    "heavy cream": (
+        Substitution("coconut cream", "1:1", "Vegan, rich texture"),
+        Substitution("cashew cream", "1:1", "Blend cashews with water"),
+        Substitution("milk + butter", "1 cup milk + 2 tbsp butter", "Mix together"),
+    ),
+    "sour cream": (
+        Substitution("greek yogurt", "1:1", "Higher protein"),
+        Substitution("coconut cream", "1:1", "Vegan option"),
+        Substitution("cashew cream", "1:1", "Blend with lemon juice"),
+    ),
+    "cream cheese": (
+        Substitution("greek yogurt", "1:1", "Lighter option"),
+        Substitution("cottage cheese", "Blend until smooth", "Lower fat"),
+        Substitution("silken tofu", "Blend with lemon juice", "Vegan option"),
+    ),
+    "parmesan cheese": (
+        Substitution("pecorino romano", "1:1", "Sharper flavor"),
+        Substitution("nutritional yeast", "2:1", "Vegan, nutty flavor"),
+        Substitution("asiago cheese", "1:1", "Milder taste"),
+    ),
 
     # Eggs
-    "egg": [
-        {"substitute": "flax egg", "ratio": "1 tbsp ground flax + 3 tbsp water per egg", "note": "Let sit 5 min"},
-        {"substitute": "chia egg", "ratio": "1 tbsp chia seeds + 3 tbsp water per egg", "note": "Let sit 5 min"},
-        {"substitute": "applesauce", "ratio": "1/4 cup per egg", "note": "For baking"},
-        {"substitute": "banana", "ratio": "1/4 cup mashed per egg", "note": "Adds sweetness"},
-        {"substitute": "silken tofu", "ratio": "1/4 cup blended per egg", "note": "For dense baked goods"},
-    ],
+    "egg": (
+        Substitution("flax egg", "1 tbsp ground flax + 3 tbsp water per egg", "Let sit 5 min"),
+        Substitution("chia egg", "1 tbsp chia seeds + 3 tbsp water per egg", "Let sit 5 min"),
+        Substitution("applesauce", "1/4 cup per egg", "For baking"),
+        Substitution("banana", "1/4 cup mashed per egg", "Adds sweetness"),
+        Substitution("silken tofu", "1/4 cup blended per egg", "For dense baked goods"),
+    ),
 
     # Flour & Grains
-    "all-purpose flour": [
-        {"substitute": "whole wheat flour", "ratio": "1:1", "note": "More fiber, denser texture"},
-        {"substitute": "almond flour", "ratio": "1:1", "note": "Gluten-free, add binding agent"},
-        {"substitute": "oat flour", "ratio": "1:1 + 1 tsp", "note": "Gluten-free, slightly sweet"},
-        {"substitute": "coconut flour", "ratio": "1/4 to 1/3 cup per 1 cup", "note": "Very absorbent, use less"},
-    ],
-    "bread crumbs": [
-        {"substitute": "crushed crackers", "ratio": "1:1", "note": "Similar texture"},
-        {"substitute": "panko", "ratio": "1:1", "note": "Lighter and crispier"},
-        {"substitute": "rolled oats", "ratio": "1:1", "note": "Pulse in food processor"},
-        {"substitute": "crushed cornflakes", "ratio": "1:1", "note": "Extra crispy"},
-    ],
-    "white rice": [
-        {"substitute": "brown rice", "ratio": "1:1", "note": "More fiber, longer cook time"},
-        {"substitute": "quinoa", "ratio": "1:1", "note": "Higher protein"},
-        {"substitute": "cauliflower rice", "ratio": "1:1", "note": "Low-carb option"},
-    ],
+    "all-purpose flour": (
+        Substitution("whole wheat flour", "1:1", "More fiber, denser texture"),
+        Substitution("almond flour", "1:1", "Gluten-free, add binding agent"),
+        Substitution("oat flour", "1:1 + 1 tsp", "Gluten-free, slightly sweet"),
+        Substitution("coconut flour", "1/4 to 1/3 cup per 1 cup", "Very absorbent, use less"),
+    ),
+    "bread crumbs": (
+        Substitution("crushed crackers", "1:1", "Similar texture"),
+        Substitution("panko", "1:1", "Lighter and crispier"),
+        Substitution("rolled oats", "1:1", "Pulse in food processor"),
+        Substitution("crushed cornflakes", "1:1", "Extra crispy"),
+    ),
+    "white rice": (
+        Substitution("brown rice", "1:1", "More fiber, longer cook time"),
+        Substitution("quinoa", "1:1", "Higher protein"),
+        Substitution("cauliflower rice", "1:1", "Low-carb option"),
+    ),
 
     # Sweeteners
-    "sugar": [
-        {"substitute": "honey", "ratio": "3/4 cup per 1 cup sugar", "note": "Reduce liquid by 1/4 cup"},
-        {"substitute": "maple syrup", "ratio": "3/4 cup per 1 cup sugar", "note": "Reduce liquid by 3 tbsp"},
-        {"substitute": "coconut sugar", "ratio": "1:1", "note": "Caramel-like flavor"},
-        {"substitute": "stevia", "ratio": "1 tsp per 1 cup sugar", "note": "Very sweet, no bulk"},
-    ],
-    "brown sugar": [
-        {"substitute": "white sugar + molasses", "ratio": "1 cup sugar + 1 tbsp molasses", "note": "Mix well"},
-        {"substitute": "coconut sugar", "ratio": "1:1", "note": "Similar moisture"},
-        {"substitute": "white sugar", "ratio": "1:1", "note": "Less moisture and flavor"},
-    ],
+    "sugar": (
+        Substitution("honey", "3/4 cup per 1 cup sugar", "Reduce liquid by 1/4 cup"),
+        Substitution("maple syrup", "3/4 cup per 1 cup sugar", "Reduce liquid by 3 tbsp"),
+        Substitution("coconut sugar", "1:1", "Caramel-like flavor"),
+        Substitution("stevia", "1 tsp per 1 cup sugar", "Very sweet, no bulk"),
+    ),
+    "brown sugar": (
+        Substitution("white sugar + molasses", "1 cup sugar + 1 tbsp molasses", "Mix well"),
+        Substitution("coconut sugar", "1:1", "Similar moisture"),
+        Substitution("white sugar", "1:1", "Less moisture and flavor"),
+    ),
 
     # Oils & Fats
-    "vegetable oil": [
-        {"substitute": "canola oil", "ratio": "1:1", "note": "Neutral flavor"},
-        {"substitute": "coconut oil", "ratio": "1:1", "note": "Solid at room temp"},
-        {"substitute": "olive oil", "ratio": "1:1", "note": "Fruity flavor"},
-        {"substitute": "applesauce", "ratio": "1/2 cup per 1 cup oil", "note": "For baking, lower fat"},
-    ],
-    "olive oil": [
-        {"substitute": "avocado oil", "ratio": "1:1", "note": "Higher smoke point"},
-        {"substitute": "grapeseed oil", "ratio": "1:1", "note": "Neutral flavor"},
-        {"substitute": "vegetable oil", "ratio": "1:1", "note": "More neutral"},
-    ],
+    "vegetable oil": (
+        Substitution("canola oil", "1:1", "Neutral flavor"),
+        Substitution("coconut oil", "1:1", "Solid at room temp"),
+        Substitution("olive oil", "1:1", "Fruity flavor"),
+        Substitution("applesauce", "1/2 cup per 1 cup oil", "For baking, lower fat"),
+    ),
+    "olive oil": (
+        Substitution("avocado oil", "1:1", "Higher smoke point"),
+        Substitution("grapeseed oil", "1:1", "Neutral flavor"),
+        Substitution("vegetable oil", "1:1", "More neutral"),
+    ),
 
     # Proteins
-    "ground beef": [
-        {"substitute": "ground turkey", "ratio": "1:1", "note": "Leaner option"},
-        {"substitute": "ground chicken", "ratio": "1:1", "note": "Very lean"},
-        {"substitute": "lentils", "ratio": "1 cup cooked per 1 lb meat", "note": "Vegetarian, high fiber"},
-        {"substitute": "mushrooms", "ratio": "Finely chopped, 1:1", "note": "Meaty texture"},
-    ],
-    "chicken breast": [
-        {"substitute": "turkey breast", "ratio": "1:1", "note": "Similar texture"},
-        {"substitute": "pork tenderloin", "ratio": "1:1", "note": "Slightly richer"},
-        {"substitute": "tofu", "ratio": "Press and marinate", "note": "Vegetarian option"},
-        {"substitute": "cauliflower", "ratio": "In florets", "note": "Vegetarian, roast well"},
-    ],
-    "bacon": [
-        {"substitute": "turkey bacon", "ratio": "1:1", "note": "Lower fat"},
-        {"substitute": "prosciutto", "ratio": "1:1", "note": "Italian style"},
-        {"substitute": "tempeh bacon", "ratio": "Marinated and cooked", "note": "Vegan option"},
-        {"substitute": "coconut bacon", "ratio": "Baked coconut flakes", "note": "Vegan, crunchy"},
-    ],
+    "ground beef": (
+        Substitution("ground turkey", "1:1", "Leaner option"),
+        Substitution("ground chicken", "1:1", "Very lean"),
+        Substitution("lentils", "1 cup cooked per 1 lb meat", "Vegetarian, high fiber"),
+        Substitution("mushrooms", "Finely chopped, 1:1", "Meaty texture"),
+    ),
+    "chicken breast": (
+        Substitution("turkey breast", "1:1", "Similar texture"),
+        Substitution("pork tenderloin", "1:1", "Slightly richer"),
+        Substitution("tofu", "Press and marinate", "Vegetarian option"),
+        Substitution("cauliflower", "In florets", "Vegetarian, roast well"),
+    ),
+    "bacon": (
+        Substitution("turkey bacon", "1:1", "Lower fat"),
+        Substitution("prosciutto", "1:1", "Italian style"),
+        Substitution("tempeh bacon", "Marinated and cooked", "Vegan option"),
+        Substitution("coconut bacon", "Baked coconut flakes", "Vegan, crunchy"),
+    ),
 
     # Aromatics & Seasonings
-    "garlic": [
-        {"substitute": "garlic powder", "ratio": "1/8 tsp per clove", "note": "Less fresh flavor"},
-        {"substitute": "shallots", "ratio": "1:1", "note": "Milder, sweeter"},
-        {"substitute": "garlic scapes", "ratio": "1:1", "note": "Milder, seasonal"},
-    ],
-    "onion": [
-        {"substitute": "shallots", "ratio": "3 shallots per 1 onion", "note": "Milder and sweeter"},
-        {"substitute": "leeks", "ratio": "1 cup sliced per 1 onion", "note": "Milder flavor"},
-        {"substitute": "onion powder", "ratio": "1 tbsp per 1 medium onion", "note": "Convenience option"},
-    ],
-    "fresh herbs": [
-        {"substitute": "dried herbs", "ratio": "1 tsp dried per 1 tbsp fresh", "note": "More concentrated"},
-        {"substitute": "herb paste", "ratio": "1:1", "note": "Convenient"},
-        {"substitute": "frozen herbs", "ratio": "1:1", "note": "Better than dried"},
-    ],
+    "garlic": (
+        Substitution("garlic powder", "1/8 tsp per clove", "Less fresh flavor"),
+        Substitution("shallots", "1:1", "Milder, sweeter"),
+        Substitution("garlic scapes", "1:1", "Milder, seasonal"),
+    ),
+    "onion": (
+        Substitution("shallots", "3 shallots per 1 onion", "Milder and sweeter"),
+        Substitution("leeks", "1 cup sliced per 1 onion", "Milder flavor"),
+        Substitution("onion powder", "1 tbsp per 1 medium onion", "Convenience option"),
+    ),
+    "fresh herbs": (
+        Substitution("dried herbs", "1 tsp dried per 1 tbsp fresh", "More concentrated"),
+        Substitution("herb paste", "1:1", "Convenient"),
+        Substitution("frozen herbs", "1:1", "Better than dried"),
+    ),
 
     # Liquids
-    "chicken broth": [
-        {"substitute": "vegetable broth", "ratio": "1:1", "note": "Vegetarian option"},
-        {"substitute": "bouillon cube + water", "ratio": "1 cube per cup", "note": "More sodium"},
-        {"substitute": "water + soy sauce", "ratio": "Add 1 tbsp soy per cup", "note": "Umami flavor"},
-    ],
-    "wine": [
-        {"substitute": "broth", "ratio": "1:1", "note": "Non-alcoholic"},
-        {"substitute": "apple cider vinegar", "ratio": "1/4 cup per cup wine", "note": "Add water to fill"},
-        {"substitute": "grape juice", "ratio": "1:1", "note": "Sweeter option"},
-    ],
-    "soy sauce": [
-        {"substitute": "tamari", "ratio": "1:1", "note": "Gluten-free"},
-        {"substitute": "coconut aminos", "ratio": "1:1", "note": "Soy-free, sweeter"},
-        {"substitute": "worcestershire sauce", "ratio": "1:1", "note": "Different flavor profile"},
-    ],
+    "chicken broth": (
+        Substitution("vegetable broth", "1:1", "Vegetarian option"),
+        Substitution("bouillon cube + water", "1 cube per cup", "More sodium"),
+        Substitution("water + soy sauce", "Add 1 tbsp soy per cup", "Umami flavor"),
+    ),
+    "wine": (
+        Substitution("broth", "1:1", "Non-alcoholic"),
+        Substitution("apple cider vinegar", "1/4 cup per cup wine", "Add water to fill"),
+        Substitution("grape juice", "1:1", "Sweeter option"),
+    ),
+    "soy sauce": (
+        Substitution("tamari", "1:1", "Gluten-free"),
+        Substitution("coconut aminos", "1:1", "Soy-free, sweeter"),
+        Substitution("worcestershire sauce", "1:1", "Different flavor profile"),
+    ),
 
     # Acids
-    "lemon juice": [
-        {"substitute": "lime juice", "ratio": "1:1", "note": "Similar acidity"},
-        {"substitute": "white wine vinegar", "ratio": "1:1", "note": "More sharp"},
-        {"substitute": "apple cider vinegar", "ratio": "1:1", "note": "Fruitier"},
-    ],
-    "vinegar": [
-        {"substitute": "lemon juice", "ratio": "1:1", "note": "Fresh flavor"},
-        {"substitute": "lime juice", "ratio": "1:1", "note": "Citrus note"},
-    ],
-}
-
-
-def get_substitutions(ingredient: str) -> list[dict] | None:
+    "lemon juice": (
+        Substitution("lime juice", "1:1", "Similar acidity"),
+        Substitution("white wine vinegar", "1:1", "More sharp"),
+        Substitution("apple cider vinegar", "1:1", "Fruitier"),
+    ),
+    "vinegar": (
+        Substitution("lemon juice", "1:1", "Fresh flavor"),
+        Substitution("lime juice", "1:1", "Citrus note"),
+    ),
+})
+
+
+@lru_cache(maxsize=1024)
+def get_substitutions(ingredient: str) -> tuple[Substitution, ...] | None:
     """
     Get substitution suggestions for an ingredient.
 
+    Results are memoised; the table is static and the same ingredient names
+    come up on every recipe page.
+
     Args:
         ingredient: The ingredient name to find substitutions for
 
     Returns:
-        List of substitution dictionaries with 'substitute', 'ratio', and 'note' keys,
+        Substitutions with 'substitute', 'ratio', and 'note' attributes,
         or None if no substitutions are available
     """
     ingredient_lower = ingredient.lower().strip()
@@ -175,7 +192,19 @@ def get_substitutions(ingredient: str) -> list[dict] | None:
     if ingredient_lower in SUBSTITUTIONS:
         return SUBSTITUTIONS[ingredient_lower]
 
-    # Partial match (e.g., "whole milk" matches "milk")
+    # Whole-word match, two-word keys first so "light brown sugar" gets the
+    # "brown sugar" options rather than plain "sugar"
+    words = ingredient_lower.split()
+    for first, second in pairwise(words):
+        subs = SUBSTITUTIONS.get(f"{first} {second}")
+        if subs is not None:
+            return subs
+    for word in words:
+        subs = SUBSTITUTIONS.get(word)
+        if subs is not None:
+            return subs
+
+    # Partial match (e.g., "eggs" matches "egg")
     for key in SUBSTITUTIONS:
         if key in ingredient_lower or ingredient_lower in key:
             return SUBSTITUTIONS[key]
@@ -183,6 +212,6 @@ def get_substitutions(ingredient: str) -> list[dict] | None:
     return None
 
 
-def format_substitution(sub: dict) -> str:
-    """Format a substitution dict into a readable string."""
-    return f"{sub['substitute']} ({sub['ratio']}) - {sub['note']}"
+def format_substitution(sub: Substitution) -> str:
+    """Format a substitution into a readable string."""
+    return f"{sub.substitute} ({sub.ratio}) - {sub.note}"
@@ -5,14 +5,64 @@ Fetches Instagram post data (description, media) for recipe extraction.
 Handles session management and provides clear error messages.
 """
 
+import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
-import instaloader
-
 from app import config
 
+logger = logging.getLogger(__name__)
+
+# Matches post and reel URLs, e.g.:
+# https://www.instagram.com/p/ABC123/
+# https://instagram.com/p/ABC123
+# https://www.instagram.com/reel/ABC123/
+_SHORTCODE_RE = re.compile(r'instagram\.com/(?:p|reel)/([A-Za-z0-9_-]+)')
+
+# Comments scanned for the owner's recipe text; more risks rate limiting
+_MAX_COMMENTS = 50
+
+# Standard session file name: [.]instaloader-session-USERNAME
+_SESSION_FILE_RE = re.compile(r'\.?instaloader-session-(.*)')
+
+# A caption with an ingredients heading followed by a method heading already
+# holds the whole recipe, so the owner's comments are not fetched. Each
+# heading must sit on its own line: "full ingredients and steps in the
+# comments" points at the comments rather than replacing them.
+_CAPTION_LOOKS_COMPLETE_RE = re.compile(
+    r'^\s*(?:ingredients?|ingrédients?)\s*:?\s*$'
+    r'.*'
+    r'^\s*(?:instructions?|directions?|steps?|method|preparation|préparation|étapes?)\s*:?\s*$',
+    re.IGNORECASE | re.DOTALL | re.MULTILINE,
+)
+
+# Shown whenever Instagram refuses the request (HTTP 403)
+_BLOCKED_MESSAGE = (
+    "Instagram blocked the request (403 Forbidden). This is very common!\n\n"
+    "🔧 SOLUTION 1 - Manual Paste (Easiest):\n"
+    "1. Visit the Instagram post in your browser\n"
+    "2. Copy the full post text (caption + any recipe comments)\n"
+    "3. Use the 'Import from Text' endpoint instead:\n"
+    "   POST /import-recipe-text with {\"text\": \"...\"}\n\n"
+    "🔧 SOLUTION 2 - Set Up Instagram Session (For Automatic Fetching):\n"
+    "1. Run: instaloader --login=YOUR_USERNAME\n"
+    "2. Set: export INSTAGRAM_SESSION_FILE=~/.instaloader-session-YOUR_USERNAME\n"
+    "3. Restart the app\n\n"
+    "The manual paste method works 100% of the time!"
+)
+
+
+def _is_blocked(error_msg: str) -> bool:
+    """Return True if *error_msg* looks like Instagram's 403 Forbidden block."""
+    return "403" in error_msg or "Forbidden" in error_msg
+
 
 class InstagramFetchError(Exception):
     """Raised when Instagram post cannot be fetched."""
@@ -29,6 +79,59 @@ class InstagramPost:
     has_owner_comments: bool = False  # Whether owner comments were included
 
 
+# Recently fetched posts by shortcode, so a retried or duplicate import of the
+# same post skips Instagram entirely. Shared by all fetchers; oldest first.
+_POST_CACHE_TTL_S = 3600.0
+_POST_CACHE_MAX = 256
+_post_cache: OrderedDict[str, tuple[float, InstagramPost]] = OrderedDict()
+_post_cache_lock = threading.Lock()
+
+
+def _get_cached_post(shortcode: str) -> InstagramPost | None:
+    """Return the cached post for *shortcode* if it is still fresh."""
+    with _post_cache_lock:
+        entry = _post_cache.get(shortcode)
+        if entry is None:
+            return None
+        fetched_at, post = entry
+        if time.monotonic() - fetched_at > _POST_CACHE_TTL_S:
+            del _post_cache[shortcode]
+            return None
+        return post
+
+
+def _cache_post(post: InstagramPost) -> None:
+    """Remember *post*, evicting the oldest entry when the cache is full."""
+    with _post_cache_lock:
+        _post_cache[post.shortcode] = (time.monotonic(), post)
+        _post_cache.move_to_end(post.shortcode)
+        if len(_post_cache) > _POST_CACHE_MAX:
+            _post_cache.popitem(last=False)
+
+
+# One lock per shortcode being fetched, so concurrent imports of the same
+# post wait for the first fetch and then hit the cache instead of fetching it
+# again. Entries are dropped once nobody holds or waits.
+_shortcode_locks: dict[str, list] = {}  # shortcode -> [lock, users]
+_shortcode_locks_guard = threading.Lock()
+
+
+@contextmanager
+def _shortcode_lock(shortcode: str):
+    """Hold the fetch lock for *shortcode*."""
+    with _shortcode_locks_guard:
+        entry = _shortcode_locks.setdefault(shortcode, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _shortcode_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _shortcode_locks[shortcode]
+
+
 class InstagramFetcher:
     """Fetches Instagram posts using Instaloader."""
 
@@ -39,7 +142,11 @@ class InstagramFetcher:
         Args:
             session_file: Path to Instaloader session file (optional)
         """
-        print(f"session_file={session_file}")
+        logger.debug("Initializing Instagram fetcher", extra={"session_file": session_file})
+        # Imported here, not at module level: instaloader pulls in requests
+        # and friends (~100 ms), which text-only imports never need.
+        import instaloader
+
         self.loader = instaloader.Instaloader(
             download_pictures=False,
             download_videos=False,
@@ -52,10 +159,23 @@ class InstagramFetcher:
         )
 
         self.session_file = session_file or config.INSTAGRAM_SESSION_FILE
-        self._load_session()
+        # The fetcher is shared per process and Instaloader is not
+        # thread-safe, so the loader is used by one fetch at a time.
+        self._lock = threading.Lock()
+        # A failed session load is retried on the next fetch rather than
+        # sticking until a restart.
+        self._session_loaded = self._load_session()
+
+    def _ensure_session(self):
+        """Retry loading the session if an earlier attempt did not succeed.
 
-    def _load_session(self):
-        """Load saved Instagram session if available."""
+        Called with ``self._lock`` held.
+        """
+        if not self._session_loaded and self.session_file:
+            self._session_loaded = self._load_session()
+
+    def _load_session(self) -> bool:
+        """Load saved Instagram session if available; return True on success."""
         if self.session_file and Path(self.session_file).exists():
             try:
                 session_path = Path(self.session_file)
@@ -64,28 +184,28 @@ class InstagramFetcher:
                 # Standard format: ~/.instaloader-session-USERNAME
                 filename = session_path.name
 
-                # Try different session file formats
-                if filename.startswith('.instaloader-session-'):
-                    username = filename.replace('.instaloader-session-', '')
-                elif filename.startswith('instaloader-session-'):
-                    username = filename.replace('instaloader-session-', '')
-                elif '-' in filename:
-                    # Extract everything after the last dash
-                    username = filename.split('-')[-1]
+                # Failing that, take everything after the last dash, or the
+                # whole filename if it has none
+                match = _SESSION_FILE_RE.match(filename)
+                if match:
+                    username = match.group(1)
                 else:
-                    # Filename is the username
-                    username = filename.replace('.instaloader-session', '')
+                    username = filename.rsplit('-', 1)[-1].replace('.instaloader-session', '')
 
                 if username:
-                    print(f"[Instagram] Loading session for user: {username}")
+                    logger.debug("Loading Instagram session", extra={"username": username})
                     self.loader.load_session_from_file(username, str(session_path))
-                    print("[Instagram] Session loaded successfully!")
+                    logger.info("Instagram session loaded", extra={"username": username})
+                    return True
 
             except FileNotFoundError:
-                print(f"[Instagram] Session file not found: {self.session_file}")
-            except Exception as e:
-                print(f"[Instagram] Session load failed: {type(e).__name__}: {str(e)}")
-                print("[Instagram] Will attempt without authentication (may fail)")
+                logger.warning("Instagram session file not found", extra={"session_file": self.session_file})
+            except Exception:
+                logger.warning(
+                    "Instagram session load failed, continuing without authentication (may fail)",
+                    exc_info=True,
+                )
+        return False
 
     def _fetch_owner_comments(self, post) -> list[str]:
         """
@@ -99,20 +219,13 @@ class InstagramFetcher:
         """
         owner_comments = []
         try:
+            owner = post.owner_username
             # Fetch up to 50 comments (to avoid rate limiting)
-            comment_count = 0
-            max_comments = 50
-
-            for comment in post.get_comments():
-                if comment_count >= max_comments:
-                    break
-
+            for comment in islice(post.get_comments(), _MAX_COMMENTS):
                 # Check if comment is from post owner
-                if comment.owner.username == post.owner_username:
+                if comment.owner.username == owner:
                     owner_comments.append(comment.text)
 
-                comment_count += 1
-
         except Exception:
             # If we can't fetch comments (rate limit, login required, etc.),
             # just return empty list - we'll still have the caption
@@ -133,12 +246,7 @@ class InstagramFetcher:
         Raises:
             InstagramFetchError: If URL format is invalid
         """
-        # Match patterns like:
-        # https://www.instagram.com/p/ABC123/
-        # https://instagram.com/p/ABC123
-        # https://www.instagram.com/reel/ABC123/
-        pattern = r'instagram\.com/(?:p|reel)/([A-Za-z0-9_-]+)'
-        match = re.search(pattern, url)
+        match = _SHORTCODE_RE.search(url)
 
         if not match:
             raise InstagramFetchError(
@@ -153,6 +261,10 @@ class InstagramFetcher:
         """
         Fetch Instagram post data.
 
+        The owner's comments are only fetched (up to 50, one paginated request
+        per page) when the caption does not already look like a complete
+        recipe, i.e. lacks an ingredients heading followed by a method heading.
+
         Args:
             url: Instagram post or reel URL
 
@@ -167,6 +279,24 @@ class InstagramFetcher:
         except InstagramFetchError:
             raise
 
+        cached = _get_cached_post(shortcode)
+        if cached is not None:
+            logger.debug("Instagram post served from cache", extra={"shortcode": shortcode})
+            return cached
+
+        with _shortcode_lock(shortcode):
+            # Another request may have fetched this post while we waited
+            cached = _get_cached_post(shortcode)
+            if cached is not None:
+                return cached
+            with self._lock:
+                self._ensure_session()
+                return self._fetch_uncached(shortcode)
+
+    def _fetch_uncached(self, shortcode: str) -> InstagramPost:
+        """Fetch *shortcode* from Instagram and cache the result."""
+        import instaloader
+
         try:
             # Fetch post using shortcode
             post = instaloader.Post.from_shortcode(self.loader.context, shortcode)
@@ -174,17 +304,15 @@ class InstagramFetcher:
             # Extract description (caption)
             caption = post.caption or ""
 
-            # Fetch owner's comments (where full recipe often lives)
-            owner_comments = self._fetch_owner_comments(post)
-
-            # Combine caption + owner comments
-            description_parts = []
-            if caption:
-                description_parts.append(caption)
-            if owner_comments:
-                description_parts.extend(owner_comments)
+            # Fetch owner's comments (where full recipe often lives), unless
+            # the caption already has both ingredients and steps
+            if caption and _CAPTION_LOOKS_COMPLETE_RE.search(caption):
+                owner_comments = []
+            else:
+                owner_comments = self._fetch_owner_comments(post)
 
-            description = "\n\n".join(description_parts)
+            # Combine caption + owner comments, skipping empty ones
+            description = "\n\n".join(filter(None, (caption, *owner_comments)))
 
             if not description:
                 raise InstagramFetchError(
@@ -211,13 +339,15 @@ class InstagramFetcher:
             else:
                 media_urls.append(post.url)
 
-            return InstagramPost(
+            result = InstagramPost(
                 description=description,
                 media_urls=media_urls,
                 media_type=media_type,
                 shortcode=shortcode,
                 has_owner_comments=has_owner_comments
             )
+            _cache_post(result)
+            return result
 
         except instaloader.exceptions.BadResponseException as e:
             # Instagram is blocking the request or post doesn't exist
@@ -244,20 +374,8 @@ class InstagramFetcher:
         except instaloader.exceptions.ConnectionException as e:
             error_msg = str(e)
             # Check if this is a 403 Forbidden error (Instagram blocking)
-            if "403" in error_msg or "Forbidden" in error_msg:
-                raise InstagramFetchError(
-                    "Instagram blocked the request (403 Forbidden). This is very common!\n\n"
-                    "🔧 SOLUTION 1 - Manual Paste (Easiest):\n"
-                    "1. Visit the Instagram post in your browser\n"
-                    "2. Copy the full post text (caption + any recipe comments)\n"
-                    "3. Use the 'Import from Text' endpoint instead:\n"
-                    "   POST /import-recipe-text with {\"text\": \"...\"}\n\n"
-                    "🔧 SOLUTION 2 - Set Up Instagram Session (For Automatic Fetching):\n"
-                    "1. Run: instaloader --login=YOUR_USERNAME\n"
-                    "2. Set: export INSTAGRAM_SESSION_FILE=~/.instaloader-session-YOUR_USERNAME\n"
-                    "3. Restart the app\n\n"
-                    "The manual paste method works 100% of the time!"
-                ) from e
+            if _is_blocked(error_msg):
+                raise InstagramFetchError(_BLOCKED_MESSAGE) from e
             raise InstagramFetchError(
                 f"Failed to connect to Instagram: {error_msg}. "
                 "Please check your internet connection or try the manual paste fallback."
@@ -265,21 +383,15 @@ class InstagramFetcher:
         except Exception as e:
             error_msg = str(e)
             # Also check for 403 in generic exceptions
-            if "403" in error_msg or "Forbidden" in error_msg or "graphql" in error_msg.lower():
-                raise InstagramFetchError(
-                    "Instagram blocked the request (403 Forbidden). This is very common!\n\n"
-                    "🔧 SOLUTION 1 - Manual Paste (Easiest):\n"
-                    "1. Visit the Instagram post in your browser\n"
-                    "2. Copy the full post text (caption + any recipe comments)\n"
-                    "3. Use the 'Import from Text' endpoint instead:\n"
-                    "   POST /import-recipe-text with {\"text\": \"...\"}\n\n"
-                    "🔧 SOLUTION 2 - Set Up Instagram Session (For Automatic Fetching):\n"
-                    "1. Run: instaloader --login=YOUR_USERNAME\n"
-                    "2. Set: export INSTAGRAM_SESSION_FILE=~/.instaloader-session-YOUR_USERNAME\n"
-                    "3. Restart the app\n\n"
-                    "The manual paste method works 100% of the time!"
-                ) from e
+            if _is_blocked(error_msg) or "graphql" in error_msg.lower():
+                raise InstagramFetchError(_BLOCKED_MESSAGE) from e
             raise InstagramFetchError(
                 f"Unexpected error fetching Instagram post: {error_msg}. "
                 "Please try the manual paste fallback."
             ) from e
+
+
+@lru_cache(maxsize=4)
+def get_instagram_fetcher(session_file: str | None = None) -> InstagramFetcher:
+    """Return the shared fetcher for *session_file*, loading the session once."""
+    return InstagramFetcher(session_file=session_file)
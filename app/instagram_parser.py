@@ -5,10 +5,11 @@ Combines fetching, AI extraction, and normalization to parse Instagram recipes.
 """
 
 import logging
+from functools import cached_property
 
 from app.ai_recipe_extractor import AIExtractionError, AIRecipeExtractor
-from app.ingredient_normalizer import normalize_ingredient
-from app.instagram_fetcher import InstagramFetcher, InstagramFetchError
+from app.ingredient_normalizer import normalize_ingredients
+from app.instagram_fetcher import InstagramFetchError, get_instagram_fetcher
 from app.recipe_parser import ParsedRecipe
 
 logger = logging.getLogger(__name__)
@@ -25,9 +26,14 @@ class InstagramParser:
             openai_api_key: OpenAI API key for AI extraction
             instagram_session_file: Path to Instagram session file (optional)
         """
-        self.fetcher = InstagramFetcher(session_file=instagram_session_file)
+        self.instagram_session_file = instagram_session_file
         self.extractor = AIRecipeExtractor(openai_api_key=openai_api_key)
 
+    @cached_property
+    def fetcher(self):
+        """Instagram fetcher, built on first use so parse_from_text never loads instaloader."""
+        return get_instagram_fetcher(self.instagram_session_file)
+
     def parse(self, url: str) -> ParsedRecipe:
         """
         Parse recipe from Instagram URL.
@@ -63,10 +69,7 @@ class InstagramParser:
             raise
 
         # Step 3: Normalize ingredients
-        normalized_ingredients = []
-        for ingredient in extracted.ingredients:
-            normalized = normalize_ingredient(ingredient)
-            normalized_ingredients.append(normalized)
+        normalized_ingredients = normalize_ingredients(extracted.ingredients)
 
         # Step 4: Build tags
         tags = ["instagram", "ai-extracted"]
@@ -120,17 +123,15 @@ class InstagramParser:
         try:
             extracted = self.extractor.extract_recipe(
                 text=text,
-                source_hint="manual_paste"
+                source_hint="manual_paste",
+                language=language,
             )
         except AIExtractionError:
             logger.exception("AI extraction failed for manually pasted text", extra={"text_length": len(text)})
             raise
 
         # Step 2: Normalize ingredients
-        normalized_ingredients = []
-        for ingredient in extracted.ingredients:
-            normalized = normalize_ingredient(ingredient)
-            normalized_ingredients.append(normalized)
+        normalized_ingredients = normalize_ingredients(extracted.ingredients)
 
         # Step 3: Build tags
         tags = ["manual-import", "ai-extracted"]
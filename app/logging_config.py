@@ -19,9 +19,23 @@ import sys
 
 from pythonjsonlogger.json import JsonFormatter
 
+# Handler installed by configure_logging, kept so repeat calls can reuse it
+_handler: logging.Handler | None = None
+
 
 def configure_logging(level: str = "INFO") -> None:
-    """Configure root logger with a structured JSON formatter."""
+    """Configure root logger with a structured JSON formatter.
+
+    Safe to call repeatedly: once our handler is installed, later calls only
+    update the level.
+    """
+    global _handler
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+    if _handler is not None and root.handlers == [_handler]:
+        return
+
     try:
         formatter: logging.Formatter = JsonFormatter(
             "%(asctime)s %(levelname)s %(name)s %(message)s"
@@ -34,13 +48,11 @@ def configure_logging(level: str = "INFO") -> None:
             datefmt="%Y-%m-%dT%H:%M:%S",
         )
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(formatter)
 
-    root = logging.getLogger()
-    root.setLevel(getattr(logging, level.upper(), logging.INFO))
     # Avoid duplicate handlers if called more than once
-    root.handlers = [handler]
+    root.handlers = [_handler]
 
     # Quieten noisy third-party loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
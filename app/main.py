@@ -16,6 +16,7 @@ from slowapi.util import get_remote_address
 from app import config
 from app.db.engine import AsyncSessionLocal, engine, ensure_default_household
 from app.logging_config import configure_logging
+from app.openai_client import warm_up_openai_client
 
 # Configure structured JSON logging at import time
 configure_logging(os.environ.get("LOG_LEVEL", "INFO"))
@@ -44,9 +45,16 @@ def _run_migrations() -> None:
     command.upgrade(alembic_cfg, "head")
 
 
+def _log_warm_up_failure(future: asyncio.Future) -> None:
+    """Log an OpenAI warm-up that raised instead of completing."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("OpenAI connection warm-up crashed", exc_info=future.exception())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Startup: run DB migrations, validate config, seed default household.
+    """Startup: run DB migrations, validate config, seed default household,
+    warm up the OpenAI connection.
     Shutdown: dispose the async engine.
     """
     # Run migrations before accepting traffic; failure aborts startup.
@@ -69,6 +77,15 @@ async def lifespan(app: FastAPI):
     async with AsyncSessionLocal() as db:
         await ensure_default_household(db)
 
+    # Pre-open the OpenAI connection in the background; not awaited so a slow
+    # or unreachable API never delays startup. The future is kept on app.state
+    # and any unexpected failure is logged when it completes.
+    if config.OPENAI_API_KEY:
+        app.state.openai_warm_up = asyncio.get_running_loop().run_in_executor(
+            None, warm_up_openai_client, config.OPENAI_API_KEY
+        )
+        app.state.openai_warm_up.add_done_callback(_log_warm_up_failure)
+
     logger.info("Meal planner started", extra={"env": os.environ.get("ENV", "development")})
     yield
 
@@ -2,8 +2,10 @@
 
 import logging
 import re
+import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 
 import requests
 
@@ -148,6 +150,16 @@ class UnitConverter:
         return None
 
 
+@lru_cache(maxsize=1)
+def _get_usda_session() -> requests.Session:
+    """Return the process-wide keep-alive session for the USDA API.
+
+    A NutritionGenerator is built per import, so a session per client would
+    pay a fresh TCP + TLS handshake to api.nal.usda.gov on every import.
+    """
+    return requests.Session()
+
+
 class USDAFoodDataClient:
     """Client for USDA FoodData Central API."""
 
@@ -164,21 +176,24 @@ class USDAFoodDataClient:
             api_key: Optional USDA FoodData Central API key.
                      Get a free key at: https://fdc.nal.usda.gov/api-key-signup.html
         """
-        self.session = requests.Session()
+        self.session = _get_usda_session()
         self.api_key = api_key
         self._last_request_time = 0.0
+        # Imports run in worker threads and share one client (see
+        # get_nutrition_generator), so callers queue here for their slot.
+        self._rate_lock = threading.Lock()
 
     def _rate_limit(self):
         """Enforce rate limiting between API requests."""
-        import time
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        with self._rate_lock:
+            current_time = time.time()
+            time_since_last = current_time - self._last_request_time
 
-        if time_since_last < self.MIN_REQUEST_INTERVAL:
-            sleep_time = self.MIN_REQUEST_INTERVAL - time_since_last
-            time.sleep(sleep_time)
+            if time_since_last < self.MIN_REQUEST_INTERVAL:
+                sleep_time = self.MIN_REQUEST_INTERVAL - time_since_last
+                time.sleep(sleep_time)
 
-        self._last_request_time = time.time()
+            self._last_request_time = time.time()
 
     def search_foods(self, query: str, page_size: int = 5) -> list[dict]:
         """Search for foods in USDA database.
@@ -577,3 +592,14 @@ class NutritionGenerator:
         cleaned = re.sub(r'\s+', ' ', cleaned).strip()
 
         return cleaned
+
+
+@lru_cache(maxsize=4)
+def get_nutrition_generator(api_key: str | None = None) -> NutritionGenerator:
+    """Return the process-wide NutritionGenerator for *api_key*.
+
+    One shared instance means one USDA request schedule per process, so
+    concurrent imports stay under the API quota together instead of each
+    pacing itself from zero.
+    """
+    return NutritionGenerator(api_key=api_key)
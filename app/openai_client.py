@@ -0,0 +1,51 @@
+"""
+Shared OpenAI client.
+
+The SDK client owns an httpx connection pool, so building one per extractor
+(and therefore per request) pays a fresh TCP + TLS handshake to
+api.openai.com on every import. The client is thread-safe, so a single
+instance per API key is shared across extractors and requests.
+"""
+
+import importlib.util
+import logging
+from functools import lru_cache
+
+import httpx
+import openai
+from openai import DefaultHttpxClient, OpenAI
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 lets concurrent extractions multiplex over one connection instead of
+# opening one per in-flight request. httpx needs the h2 package for it, so
+# fall back to HTTP/1.1 if it is not installed yet (e.g. before uv sync).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=1)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for *api_key*."""
+    return OpenAI(
+        api_key=api_key,
+        max_retries=2,
+        timeout=httpx.Timeout(90.0, connect=5.0),
+        http_client=DefaultHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        ),
+    )
+
+
+def warm_up_openai_client(api_key: str) -> None:
+    """Open a keep-alive connection so the first extraction skips the TLS handshake.
+
+    Issues a cheap models.list() call on the shared client. Failures are
+    logged and ignored: warm-up is best effort and must never block startup.
+    """
+    try:
+        get_openai_client(api_key).models.list(timeout=5.0)
+    except openai.OpenAIError:
+        logger.warning("OpenAI connection warm-up failed", exc_info=True)
+    else:
+        logger.info("OpenAI connection warmed up")
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 import requests
 from bs4 import BeautifulSoup
 
-from app.ingredient_parser import IngredientParser
+from app.ingredient_parser import DEFAULT_PARSER
 
 logger = logging.getLogger(__name__)
 
@@ -320,9 +320,8 @@ class RecipeParser:
 
     def _parse_ingredient(self, ingredient_str: str) -> dict | None:
         """Parse ingredient string into structured format."""
-        parser = IngredientParser()
-        parsed = parser.parse(ingredient_str)
-        return parser.to_dict(parsed)
+        parsed = DEFAULT_PARSER.parse(ingredient_str)
+        return DEFAULT_PARSER.to_dict(parsed)
 
     def _parse_wprm(self, html: str) -> ParsedRecipe | None:
         """Parse WP Recipe Maker (WPRM) plugin data from window.wprm_recipes."""
@@ -378,7 +377,7 @@ class RecipeParser:
 
             # Extract ingredients
             ingredients = []
-            ingredient_parser = IngredientParser()
+            ingredient_parser = DEFAULT_PARSER
             ingredients_data = recipe_data.get('ingredients', [])
 
             # Handle both flat and nested ingredient structures
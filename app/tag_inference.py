@@ -1,6 +1,7 @@
 """Automatic tag inference for recipes based on content."""
 
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -190,3 +191,9 @@ class TagInferencer:
             extra={"recipe": name, "tags_added": list(set(inferred) - set(existing_tags))},
         )
         return all_tags
+
+
+@lru_cache(maxsize=1)
+def get_tag_inferencer() -> TagInferencer:
+    """Return the process-wide TagInferencer (it holds no per-recipe state)."""
+    return TagInferencer()
@@ -13,6 +13,8 @@ import os
 # check passes in the same way as production (no _is_testing() bypass needed).
 os.environ.setdefault("USDA_API_KEY", "test-key")
 os.environ.setdefault("OPENAI_API_KEY", "test-key")
+# Never read or write the on-disk AI extraction cache from tests.
+os.environ.setdefault("EXTRACTION_CACHE_FILE", "")
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -73,13 +73,12 @@ async def test_import_recipe_text_success(client, db_session: AsyncSession):
     """POST /import-recipe-text with mocked parser should succeed."""
     fake_parsed = _FakeParsedRecipe()
 
-    # Patch at source modules since imports happen inside the function body
-    with patch("app.nutrition_generator.NutritionGenerator") as MockNutri, \
-         patch("app.tag_inference.TagInferencer") as MockTags, \
-         patch("app.instagram_parser.InstagramParser") as MockParser:
+    with patch("app.api.import_routes.get_nutrition_generator") as get_nutri, \
+         patch("app.api.import_routes.get_tag_inferencer") as get_tags, \
+         patch("app.api.import_routes.InstagramParser") as MockParser:
 
-        MockNutri.return_value.should_generate_nutrition.return_value = False
-        MockTags.return_value.enhance_tags.side_effect = lambda **kw: kw.get("existing_tags", [])
+        get_nutri.return_value.should_generate_nutrition.return_value = False
+        get_tags.return_value.enhance_tags.side_effect = lambda **kw: kw.get("existing_tags", [])
         MockParser.return_value.parse_from_text.return_value = fake_parsed
 
         long_text = "This is a really long recipe text " * 5
@@ -149,3 +148,67 @@ async def test_import_recipe_image_empty_file(client):
         files={"image": ("recipe.jpg", io.BytesIO(b""), "image/jpeg")},
     )
     assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_concurrent_imports_of_same_url_are_coalesced(client, db_session: AsyncSession):
+    """A double submit of one URL should parse and save the recipe only once."""
+    import asyncio
+    import time
+
+    def slow_parse(url):
+        time.sleep(0.2)
+        return _FakeParsedRecipe()
+
+    with patch("app.api.import_routes.get_nutrition_generator") as get_nutri, \
+         patch("app.api.import_routes.get_tag_inferencer") as get_tags, \
+         patch("app.api.import_routes.RecipeParser") as MockParser:
+
+        get_nutri.return_value.should_generate_nutrition.return_value = False
+        get_tags.return_value.enhance_tags.side_effect = lambda **kw: kw.get("existing_tags", [])
+        MockParser.return_value.parse_from_url.side_effect = slow_parse
+
+        payload = {"url": "https://example.com/recipe"}
+        first, second = await asyncio.gather(
+            client.post("/import-recipe", json=payload),
+            client.post("/import-recipe", json=payload),
+        )
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert MockParser.return_value.parse_from_url.call_count == 1
+    assert len(await crud.get_recipes(db_session, TEST_HOUSEHOLD_ID)) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_import_hands_over_to_waiting_request():
+    """Cancelling the request running an import must not cancel those joined to it."""
+    import asyncio
+
+    from app.api import import_routes
+
+    class _Request:
+        async def json(self):
+            return {"url": "https://example.com/recipe"}
+
+    started = []
+
+    async def fake_import(url, db):
+        started.append(db)
+        if db == "first":
+            await asyncio.sleep(10)
+        return {"success": True, "by": db}
+
+    with patch.object(import_routes, "_import_from_url", fake_import):
+        first = asyncio.create_task(import_routes.import_recipe(_Request(), db="first"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(import_routes.import_recipe(_Request(), db="second"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == {"success": True, "by": "second"}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    assert started == ["first", "second"]
+    assert import_routes._inflight_url_imports == {}
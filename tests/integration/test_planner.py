@@ -84,6 +84,28 @@ async def test_generate_with_schedule(client, db_session: AsyncSession):
     assert days <= {"Monday", "Tuesday", "Wednesday"}
 
 
+@pytest.mark.asyncio
+async def test_generate_with_schedule_no_cook_slot_gets_reheatable_recipe(client, db_session: AsyncSession):
+    """A no-cook slot should take the only reheatable recipe, even untagged."""
+    recipes = _seed_recipes(6)
+    leftovers = create_test_recipe(recipe_id="leftovers", name="Leftovers", tags=["lunch"])
+    leftovers.reheats_well = True
+    for r in [*recipes, leftovers]:
+        await crud.upsert_recipe(db_session, r, TEST_HOUSEHOLD_ID)
+
+    schedule = {
+        "Monday": {"dinner": {"servings": 2, "can_cook": True}},
+        "Tuesday": {"dinner": {"servings": 2, "can_cook": False}},
+    }
+    resp = await client.post("/generate-with-schedule", json={"schedule": schedule})
+    assert resp.status_code == 200
+
+    plan, _, _ = await crud.get_current_plan(db_session, TEST_HOUSEHOLD_ID)
+    by_slot = {(m.day, m.meal_type): m.recipe.id for m in plan.meals}
+    assert by_slot["Tuesday", "dinner"] == "leftovers"
+    assert by_slot["Monday", "dinner"] != "leftovers"
+
+
 @pytest.mark.asyncio
 async def test_generate_with_schedule_missing_schedule(client):
     resp = await client.post("/generate-with-schedule", json={})
@@ -79,6 +79,32 @@ async def test_api_recipes_pagination(client, db_session: AsyncSession):
     assert body["pagination"]["has_next"] is True
 
 
+# ---------------------------------------------------------------------------
+# GET /recipes
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_list_recipes_summary(client, db_session: AsyncSession):
+    await crud.upsert_recipe(db_session, _sample_recipe(calories=350, protein=30.0), TEST_HOUSEHOLD_ID)
+
+    r = await client.get("/recipes")
+    assert r.status_code == 200
+    assert r.json()["recipes"] == [
+        {
+            "id": "test-chicken",
+            "name": "Test Chicken",
+            "servings": 4,
+            "prep_time_minutes": 10,
+            "cook_time_minutes": 20,
+            "total_time_minutes": 30,
+            "calories_per_serving": 350,
+            "protein_per_serving": 30.0,
+            "tags": ["dinner"],
+        }
+    ]
+
+
 # ---------------------------------------------------------------------------
 # GET /recipes/<id>
 # ---------------------------------------------------------------------------
@@ -122,6 +148,22 @@ async def test_create_recipe_minimal(client):
     assert body["recipe"]["name"] == "Simple Soup"
 
 
+@pytest.mark.asyncio
+async def test_create_recipe_avoids_existing_id(client, db_session: AsyncSession):
+    await crud.upsert_recipe(db_session, _sample_recipe(recipe_id="simple-soup", name="Simple Soup"), TEST_HOUSEHOLD_ID)
+    assert await crud.get_recipe_ids(db_session, TEST_HOUSEHOLD_ID) == {"simple-soup"}
+
+    payload = {
+        "name": "Simple Soup",
+        "servings": 4,
+        "ingredients": ["1 onion"],
+        "instructions": ["Boil everything."],
+    }
+    r = await client.post("/recipes", json=payload)
+    assert r.status_code == 200
+    assert r.json()["recipe"]["id"] == "simple-soup-2"
+
+
 @pytest.mark.asyncio
 async def test_create_recipe_missing_name(client):
     payload = {
@@ -0,0 +1,46 @@
+"""Unit tests for the local (non-API) logic of the AI recipe extractor."""
+
+import pytest
+
+from app.ai_recipe_extractor import (
+    _EXTRACTION_PROMPTS,
+    AIExtractionError,
+    AIRecipeExtractor,
+    _detect_language,
+    _looks_like_recipe,
+)
+
+
+class TestDetectLanguage:
+    def test_english_caption(self):
+        assert _detect_language("Creamy Carbonara\nIngredients:\n- 400g spaghetti") == "en"
+
+    def test_french_caption(self):
+        assert _detect_language("Soupe à l'oignon\nIngrédients:\n- 6 gros oignons") == "fr"
+
+    def test_french_markers_are_case_insensitive(self):
+        assert _detect_language("ÉTAPES :\n1. Émincer les oignons") == "fr"
+
+
+class TestExtractionPrompts:
+    def test_each_variant_ships_one_example(self):
+        assert "Creamy Carbonara" in _EXTRACTION_PROMPTS["en"]
+        assert "Soupe à l'oignon" not in _EXTRACTION_PROMPTS["en"]
+        assert "Soupe à l'oignon" in _EXTRACTION_PROMPTS["fr"]
+        assert "Creamy Carbonara" not in _EXTRACTION_PROMPTS["fr"]
+
+
+class TestLooksLikeRecipe:
+    def test_short_caption_is_rejected(self):
+        assert not _looks_like_recipe("Dinner tonight 😍")
+
+    def test_long_single_line_without_quantities_is_rejected(self):
+        assert not _looks_like_recipe("What a lovely evening with friends at the beach, so grateful")
+
+    def test_ingredient_list_is_accepted(self):
+        assert _looks_like_recipe("Creamy Carbonara\nIngredients:\n- 400g spaghetti\n- 4 eggs")
+
+    def test_trivial_input_fails_without_calling_the_api(self):
+        extractor = AIRecipeExtractor.__new__(AIRecipeExtractor)  # no client: must not be reached
+        with pytest.raises(AIExtractionError, match="too short"):
+            extractor.extract_recipe("yum!")
@@ -0,0 +1,61 @@
+"""Unit tests for the SQLite-backed AI extraction cache."""
+
+import sqlite3
+
+from app.extraction_cache import ExtractionCache, make_cache_key
+
+
+class TestMakeCacheKey:
+    def test_same_parts_same_key(self):
+        assert make_cache_key("gpt-4o", "v1", "text") == make_cache_key("gpt-4o", "v1", "text")
+
+    def test_accepts_bytes(self):
+        assert make_cache_key("gpt-4o", b"caption") == make_cache_key("gpt-4o", "caption")
+
+    def test_part_boundaries_matter(self):
+        """Concatenating parts differently must not collide."""
+        assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+    def test_prompt_version_changes_key(self):
+        assert make_cache_key("gpt-4o", "v1", "text") != make_cache_key("gpt-4o", "v2", "text")
+
+
+class TestExtractionCache:
+    def test_miss_returns_none(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache.sqlite3")
+        assert cache.get("missing") is None
+
+    def test_round_trip(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache.sqlite3")
+        value = {"name": "Carbonara", "servings": 4, "ingredients": [{"item": "egg"}]}
+        cache.set("key", value)
+        assert cache.get("key") == value
+
+    def test_overwrite(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache.sqlite3")
+        cache.set("key", {"name": "Old"})
+        cache.set("key", {"name": "New"})
+        assert cache.get("key") == {"name": "New"}
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "nested" / "cache.sqlite3"
+        ExtractionCache(path).set("key", {"name": "Soup"})
+        assert ExtractionCache(path).get("key") == {"name": "Soup"}
+
+    def test_expired_entries_are_ignored_and_pruned(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        cache = ExtractionCache(path, max_age_days=30)
+        cache.set("fresh", {"name": "Soup"})
+        cache.set("stale", {"name": "Stew"})
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "UPDATE extraction_cache SET created_at = datetime('now', '-31 days') WHERE key = 'stale'"
+            )
+
+        assert cache.get("stale") is None
+        assert cache.get("fresh") == {"name": "Soup"}
+
+        ExtractionCache(path, max_age_days=30)
+        with sqlite3.connect(path) as conn:
+            keys = {row[0] for row in conn.execute("SELECT key FROM extraction_cache")}
+        assert keys == {"fresh"}
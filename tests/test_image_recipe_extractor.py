@@ -0,0 +1,36 @@
+"""Unit tests for image preprocessing in the image recipe extractor."""
+
+import io
+
+import pytest
+
+from app.image_recipe_extractor import _prepare_image
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png_bytes(width: int, height: int) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), color=(200, 180, 160)).save(buf, "PNG")
+    return buf.getvalue()
+
+
+class TestPrepareImage:
+    def test_small_image_is_untouched(self):
+        data = _png_bytes(400, 300)
+        prepared, fmt = _prepare_image(data, "png")
+        assert prepared is data
+        assert fmt == "png"
+
+    def test_oversized_image_is_downscaled_to_jpeg(self):
+        data = _png_bytes(4000, 3000)
+        prepared, fmt = _prepare_image(data, "png")
+        assert fmt == "jpeg"
+        with Image.open(io.BytesIO(prepared)) as img:
+            assert img.format == "JPEG"
+            assert max(img.size) == 1536
+            assert img.size == (1536, 1152)
+
+    def test_undecodable_bytes_are_sent_as_is(self):
+        data = b"not an image"
+        assert _prepare_image(data, "jpeg") == (data, "jpeg")
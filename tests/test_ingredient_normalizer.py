@@ -0,0 +1,79 @@
+"""Tests for AI ingredient post-processing."""
+
+from app.ingredient_normalizer import (
+    infer_category,
+    normalize_ingredient,
+    normalize_ingredients,
+    standardize_unit,
+)
+
+
+class TestInferCategory:
+    def test_longest_keyword_wins(self):
+        assert infer_category("apple cider vinegar") == "pantry"
+        assert infer_category("apple") == "produce"
+
+    def test_keyword_listed_under_several_categories_uses_first(self):
+        # 'pepper' appears under both produce and spices
+        assert infer_category("pepper") == "produce"
+        assert infer_category("black pepper") == "spices"
+
+    def test_equal_length_tie_goes_to_first_category(self):
+        # 'pork' (meat) and 'salt' (spices) are both 4 characters
+        assert infer_category("salt pork") == "meat"
+
+    def test_keyword_inside_a_word(self):
+        assert infer_category("Chicken Breasts") == "meat"
+
+    def test_french_keyword(self):
+        assert infer_category("gruyère râpé") == "dairy"
+
+    def test_accents_are_optional(self):
+        assert infer_category("creme fraiche") == "dairy"
+        assert infer_category("Bœuf haché") == infer_category("boeuf hache") == "meat"
+
+    def test_unknown_or_empty(self):
+        assert infer_category("xyz") == "other"
+        assert infer_category("") == "other"
+
+
+class TestStandardizeUnit:
+    def test_english_and_french_units(self):
+        assert standardize_unit("Tablespoons") == "tbsp"
+        assert standardize_unit("cuillère à soupe") == "tbsp"
+
+    def test_unaccented_french_unit(self):
+        assert standardize_unit("Boite") == "can"
+        assert standardize_unit("pincees") == "pinch"
+
+    def test_plural_not_listed_in_mapping(self):
+        assert standardize_unit("pts") == "pint"
+
+    def test_unknown_unit_returned_as_is(self):
+        assert standardize_unit("Handful") == "Handful"
+
+    def test_empty_unit_is_whole(self):
+        assert standardize_unit("") == "whole"
+
+
+class TestNormalizeIngredient:
+    def test_infers_category_when_unknown(self):
+        result = normalize_ingredient({"item": "Salmon fillet", "quantity": "2", "unit": "pieces", "category": ""})
+        assert result == {"item": "Salmon fillet", "quantity": 2.0, "unit": "whole", "category": "seafood"}
+
+    def test_normalize_list_keeps_order_and_leaves_input_untouched(self):
+        raw = [
+            {"item": "olive oil", "quantity": 2, "unit": "tablespoons", "category": "oils"},
+            {"item": "garlic", "quantity": None, "unit": "cloves", "category": "vegetables"},
+        ]
+        result = normalize_ingredients(raw)
+        assert [(i["item"], i["unit"], i["category"]) for i in result] == [
+            ("olive oil", "tbsp", "pantry"),
+            ("garlic", "clove", "produce"),
+        ]
+        assert raw[0]["unit"] == "tablespoons"
+
+    def test_copy_false_normalizes_in_place(self):
+        raw = {"item": "flour", "quantity": "abc", "unit": "grams", "category": "bakery"}
+        assert normalize_ingredient(raw, copy=False) is raw
+        assert raw == {"item": "flour", "quantity": None, "unit": "g", "category": "grains"}
@@ -0,0 +1,84 @@
+"""Tests for structured ingredient-string parsing."""
+
+import pytest
+
+from app.ingredient_parser import IngredientParser
+
+
+@pytest.fixture
+def parser():
+    return IngredientParser()
+
+
+class TestCategorize:
+    @pytest.mark.parametrize(
+        ("item", "category"),
+        [
+            ("boneless chicken thighs", "meat"),
+            ("all-purpose flour", "grains"),
+            ("extra virgin olive oil", "pantry"),
+            ("ground cumin", "spices"),
+            ("water", "other"),
+            ("", "other"),
+        ],
+    )
+    def test_categories(self, parser, item, category):
+        assert parser._categorize(item) == category
+
+    def test_most_specific_keyword_wins(self, parser):
+        # Categories come from the shared table, longest keyword first
+        assert parser._categorize("peanut butter") == "pantry"
+        assert parser._categorize("black pepper") == "spices"
+        assert parser._categorize("Fresh Ginger") == "produce"
+
+    @pytest.mark.parametrize(
+        ("item", "category"),
+        [
+            ("red pepper flake", "spices"),
+            ("panko breadcrumb", "grains"),
+            ("oat bran", "grains"),
+            ("rolled oats", "grains"),
+            ("goat cheese", "dairy"),
+        ],
+    )
+    def test_singular_forms_from_the_old_parser_table(self, parser, item, category):
+        assert parser._categorize(item) == category
+
+
+class TestParse:
+    def test_prefers_weight_and_splits_notes(self, parser):
+        result = parser.parse("unsalted butter (¼ cup | 57 g), melted")
+        assert (result.item, result.quantity, result.unit, result.category, result.notes) == (
+            "unsalted butter", 57.0, "g", "dairy", "melted",
+        )
+
+    def test_leading_count_unit_and_notes(self, parser):
+        result = parser.parse("3 cloves garlic, minced")
+        assert (result.item, result.quantity, result.unit, result.notes) == ("garlic", 3.0, "cloves", "minced")
+
+    def test_mixed_fraction(self, parser):
+        result = parser.parse("1 1/2 cups whole milk")
+        assert (result.item, result.quantity, result.unit) == ("whole milk", 1.5, "cups")
+
+    def test_leading_unit_without_number(self, parser):
+        assert parser.parse("Tbsp. Avocado Oil").item == "Avocado Oil"
+
+    def test_leading_unit_with_parenthetical_measurement(self, parser):
+        result = parser.parse("Tbsp. Avocado Oil (15 ml)")
+        assert (result.item, result.quantity, result.unit) == ("Avocado Oil", 15.0, "ml")
+
+    def test_unit_word_after_leading_measurement_is_kept(self, parser):
+        assert parser.parse("1 cup whole milk").item == "whole milk"
+
+    def test_first_measurement_of_preferred_type_wins(self, parser):
+        result = parser.parse("ketchup (2 tablespoons | 1/2 cup)")
+        assert (result.quantity, result.unit) == (2.0, "tablespoons")
+
+    def test_no_measurement_defaults_to_one_serving(self, parser):
+        result = parser.parse("Lawry's Seasoned Salt season to taste")
+        assert (result.quantity, result.unit) == (1.0, "serving")
+        assert (result.item, result.notes) == ("Lawry's Seasoned Salt", "season to taste")
+
+    def test_comma_notes_take_precedence_over_earlier_hyphen(self, parser):
+        result = parser.parse("1 cup all-purpose flour, sifted")
+        assert (result.item, result.notes) == ("all-purpose flour", "sifted")
@@ -0,0 +1,27 @@
+"""Tests for ingredient substitution lookups."""
+
+from app.ingredient_substitutions import format_substitution, get_substitutions
+
+
+class TestGetSubstitutions:
+    def test_exact_match_ignores_case_and_whitespace(self):
+        subs = get_substitutions("  Butter ")
+        assert subs is not None
+        assert subs[0].substitute == "coconut oil"
+
+    def test_partial_match(self):
+        assert get_substitutions("whole milk") == get_substitutions("milk")
+
+    def test_two_word_key_beats_single_word(self):
+        assert get_substitutions("light brown sugar") == get_substitutions("brown sugar")
+
+    def test_substring_fallback(self):
+        assert get_substitutions("eggs") == get_substitutions("egg")
+
+    def test_unknown_ingredient(self):
+        assert get_substitutions("saffron") is None
+
+
+def test_format_substitution():
+    sub = get_substitutions("milk")[0]
+    assert format_substitution(sub) == "almond milk (1:1) - Best for most recipes"
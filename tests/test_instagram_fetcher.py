@@ -0,0 +1,140 @@
+"""Tests for the Instagram fetcher's local helpers (no network access)."""
+
+import threading
+import time
+
+import pytest
+
+from app import instagram_fetcher
+from app.instagram_fetcher import (
+    _CAPTION_LOOKS_COMPLETE_RE,
+    InstagramFetcher,
+    InstagramPost,
+    _cache_post,
+    _get_cached_post,
+    _shortcode_lock,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_post_cache():
+    instagram_fetcher._post_cache.clear()
+    yield
+    instagram_fetcher._post_cache.clear()
+
+
+def _post(shortcode: str) -> InstagramPost:
+    return InstagramPost(description="Pasta", media_urls=[], media_type="photo", shortcode=shortcode)
+
+
+class TestPostCache:
+    def test_hit_returns_cached_post(self):
+        post = _post("ABC123")
+        _cache_post(post)
+        assert _get_cached_post("ABC123") is post
+
+    def test_expired_entry_is_dropped(self, monkeypatch):
+        _cache_post(_post("ABC123"))
+        monkeypatch.setattr(instagram_fetcher, "_POST_CACHE_TTL_S", -1.0)
+        assert _get_cached_post("ABC123") is None
+        assert "ABC123" not in instagram_fetcher._post_cache
+
+    def test_oldest_entry_is_evicted_when_full(self, monkeypatch):
+        monkeypatch.setattr(instagram_fetcher, "_POST_CACHE_MAX", 2)
+        for shortcode in ("A", "B", "C"):
+            _cache_post(_post(shortcode))
+        assert list(instagram_fetcher._post_cache) == ["B", "C"]
+
+
+class TestCaptionLooksComplete:
+    @pytest.mark.parametrize("caption", [
+        "Creamy pasta\n\nIngredients:\n200g pasta\n1 cup cream\n\nInstructions:\nBoil the pasta.",
+        "Tarte aux pommes\nIngrédients\n3 pommes\nPréparation :\nCouper les pommes.",
+    ])
+    def test_ingredient_and_method_headings_match(self, caption):
+        assert _CAPTION_LOOKS_COMPLETE_RE.search(caption)
+
+    @pytest.mark.parametrize("caption", [
+        "Full ingredients and steps in the comments 👇",
+        "Ingredients list + method below in comments!",
+        "Ingredients:\n200g pasta\n1 cup cream\nMethod in the comments",
+    ])
+    def test_captions_pointing_at_the_comments_do_not_match(self, caption):
+        assert not _CAPTION_LOOKS_COMPLETE_RE.search(caption)
+
+
+class TestParserFetcher:
+    def test_fetcher_is_only_built_when_a_post_is_fetched(self, monkeypatch):
+        from app import instagram_parser
+
+        built = []
+        monkeypatch.setattr(instagram_parser, "get_instagram_fetcher", lambda session_file: built.append(session_file))
+        parser = instagram_parser.InstagramParser(openai_api_key="test-key")
+        assert built == []
+
+        parser.fetcher
+        assert built == [None]
+
+
+class TestShortcodeLock:
+    def test_lock_entry_is_dropped_after_use(self):
+        with _shortcode_lock("ABC123"):
+            assert "ABC123" in instagram_fetcher._shortcode_locks
+        assert "ABC123" not in instagram_fetcher._shortcode_locks
+
+    def test_other_shortcodes_are_not_blocked(self):
+        with _shortcode_lock("A"):
+            acquired = threading.Event()
+
+            def fetch_other():
+                with _shortcode_lock("B"):
+                    acquired.set()
+
+            worker = threading.Thread(target=fetch_other)
+            worker.start()
+            assert acquired.wait(timeout=1)
+            worker.join()
+
+
+class TestLoaderLock:
+    def test_different_shortcodes_do_not_use_the_loader_at_once(self, monkeypatch):
+        fetcher = InstagramFetcher.__new__(InstagramFetcher)  # skip instaloader setup
+        fetcher.session_file = None
+        fetcher._lock = threading.Lock()
+        fetcher._session_loaded = False
+        active = []
+        overlaps = []
+
+        def fetch_uncached(shortcode):
+            active.append(shortcode)
+            overlaps.append(len(active))
+            time.sleep(0.05)
+            active.remove(shortcode)
+            return _post(shortcode)
+
+        monkeypatch.setattr(fetcher, "_fetch_uncached", fetch_uncached)
+        workers = [
+            threading.Thread(target=fetcher.fetch_post, args=(f"https://www.instagram.com/p/{shortcode}/",))
+            for shortcode in ("A", "B")
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert overlaps == [1, 1]
+
+
+class TestSessionRetry:
+    def test_failed_session_load_is_retried_until_it_succeeds(self, monkeypatch):
+        fetcher = InstagramFetcher.__new__(InstagramFetcher)  # skip instaloader setup
+        fetcher.session_file = "session-user"
+        fetcher._session_loaded = False
+        attempts = iter([False, True])
+        monkeypatch.setattr(fetcher, "_load_session", lambda: next(attempts))
+
+        fetcher._ensure_session()
+        assert not fetcher._session_loaded
+        fetcher._ensure_session()
+        assert fetcher._session_loaded
+        fetcher._ensure_session()  # loaded: no further attempt (iterator exhausted)